@@ -7,6 +7,7 @@ Can be used standalone via `rhdh-local` or via the orchestrator `rhdh local`.
 from __future__ import annotations
 
 import argparse
+import os
 from pathlib import Path
 from typing import Any, Optional
 
@@ -79,14 +80,19 @@ def cmd_local_status(fmt: OutputFormatter, _args: argparse.Namespace) -> int:
 
     checks: list[dict[str, Any]] = []
 
+    # One directory read tells both whether rhdh-local exists and what it contains
+    try:
+        local_names: Optional[set[str]] = set(os.listdir(local_dir))
+    except OSError:
+        local_names = None
+
     # Check rhdh-local exists
-    if local_dir.is_dir():
+    if local_names is not None:
         checks.append({"name": "rhdh_local_dir", "status": "pass", "message": str(local_dir)})
         fmt.log_ok(f"rhdh-local: {local_dir}")
 
         # Check it is a full checkout (has compose.yaml)
-        compose_yaml = local_dir / "compose.yaml"
-        if compose_yaml.exists():
+        if "compose.yaml" in local_names:
             checks.append({"name": "rhdh_local_compose", "status": "pass", "message": "found"})
             fmt.log_ok("  compose.yaml: found (full checkout)")
         else:
@@ -135,7 +141,7 @@ def cmd_local_status(fmt: OutputFormatter, _args: argparse.Namespace) -> int:
         fmt.log_ok(f"rhdh-customizations: {customizations_dir}")
 
         # Check if customizations are synced
-        if local_dir.is_dir():
+        if local_names is not None:
             override_yaml = (
                 local_dir / "configs" / "dynamic-plugins" / "dynamic-plugins.override.yaml"
             )
@@ -10,44 +10,36 @@ Follows agentic CLI patterns:
 from __future__ import annotations
 
 import argparse
-import shutil
-import subprocess
+import json
+import sys
+import time
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Optional
+from string import hexdigits
+from typing import TYPE_CHECKING, Any, Optional
 
 from . import __version__
 from .config import (
+    REQUIRED_SUBMODULE_REPOS,
     SUBMODULE_REPOS,
+    find_git_dir,
+    find_git_root,
     get_data_dir,
     get_github_username,
     get_local_setup_dir,
+    get_project_config_path,
     get_repo,
+    get_user_config_path,
     list_submodule_repos,
+    repo_discovery_env,
     save_github_username,
     setup_submodule,
+    write_file_atomic,
 )
-from .formatters import OutputFormatter
-from .todo import (
-    add_note as todo_add_note,
-)
-from .todo import (
-    add_todo,
-    get_todo_file_path,
-    list_todos,
-    mark_done,
-)
-from .todo import (
-    show_raw as todo_show_raw,
-)
-from .worklog import (
-    add_entry as worklog_add_entry,
-)
-from .worklog import (
-    format_entry_human,
-    read_entries,
-    search_entries,
-)
-from .workspace import get_workspace, list_workspaces
+from .formatters import BLUE, GREEN, NC, RED, YELLOW, OutputFormatter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 # =============================================================================
 # Helper Functions
@@ -56,6 +48,9 @@ from .workspace import get_workspace, list_workspaces
 
 def run_command(cmd: list[str], cwd: Optional[Path] = None) -> tuple[int, str, str]:
     """Run a command and return (returncode, stdout, stderr)."""
+    # Commands that never spawn a process (log, todo, config) skip importing subprocess
+    import subprocess
+
     try:
         result = subprocess.run(cmd, capture_output=True, text=True, cwd=cwd)
         return result.returncode, result.stdout, result.stderr
@@ -63,48 +58,271 @@ def run_command(cmd: list[str], cwd: Optional[Path] = None) -> tuple[int, str, s
         return -1, "", f"Command not found: {cmd[0]}"
 
 
+def run_command_rc_only(cmd: list[str], cwd: Optional[Path] = None) -> int:
+    """Run a command for its return code only, discarding all output."""
+    import subprocess
+
+    try:
+        return subprocess.run(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, cwd=cwd
+        ).returncode
+    except FileNotFoundError:
+        return -1
+
+
+def run_command_raw(cmd: list[str], cwd: Optional[Path] = None) -> tuple[int, bytes]:
+    """Run a command and return (returncode, stdout) as undecoded bytes, discarding stderr."""
+    import subprocess
+
+    try:
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, cwd=cwd)
+        return result.returncode, result.stdout
+    except FileNotFoundError:
+        return -1, b""
+
+
+@lru_cache(maxsize=None)
+def resolve_tool(name: str) -> Optional[str]:
+    """Resolve a tool's path in PATH, looking each name up once per process."""
+    # Only status and doctor look tools up, so other commands skip importing shutil
+    import shutil
+
+    return shutil.which(name)
+
+
 def check_tool(name: str) -> bool:
     """Check if a tool is available in PATH."""
-    return shutil.which(name) is not None
+    return resolve_tool(name) is not None
 
 
 def get_git_branch(repo_path: Path) -> str:
-    """Get current git branch for a repo."""
+    """Get current git branch for a repo.
+
+    Reads HEAD directly; a detached HEAD yields the short commit SHA.
+    Falls back to git only when HEAD has unexpected content.
+    """
+    git_dir = find_git_dir(repo_path)
+    if git_dir:
+        try:
+            head = (git_dir / "HEAD").read_text().strip()
+        except OSError:
+            head = ""
+        if head.startswith("ref: refs/heads/"):
+            return head[len("ref: refs/heads/") :]
+        if len(head) >= 40 and all(c in hexdigits for c in head):
+            return head[:7]
     rc, stdout, _ = run_command(["git", "branch", "--show-current"], cwd=repo_path)
     return stdout.strip() if rc == 0 else "unknown"
 
 
 def has_uncommitted_changes(repo_path: Path) -> bool:
     """Check if repo has uncommitted changes."""
-    rc, stdout, _ = run_command(["git", "status", "--porcelain"], cwd=repo_path)
+    rc, stdout = run_command_raw(["git", "status", "--porcelain"], cwd=repo_path)
     return rc == 0 and bool(stdout.strip())
 
 
+def get_repo_snapshot(repo_path: Path) -> tuple[str, bool, bool]:
+    """Get (branch, is_clean, is_git_repo) for a repo with a single git call.
+
+    Cleanliness comes from `git status --porcelain`; the branch is read
+    from HEAD, which avoids `--branch` computing ahead/behind counts. Only
+    the emptiness of the porcelain output matters, so it is never decoded.
+    """
+    rc, stdout = run_command_raw(["git", "status", "--porcelain"], cwd=repo_path)
+    if rc != 0:
+        return "unknown", True, False
+    return get_git_branch(repo_path), not stdout.strip(), True
+
+
+# One GraphQL round-trip answers both "is gh authenticated" and
+# "can we see the overlay repo"
+GH_ACCESS_QUERY = (
+    "{ viewer { login } "
+    'repository(owner: "redhat-developer", name: "rhdh-plugin-export-overlays") { id } }'
+)
+
+
+def check_gh_access() -> tuple[bool, bool]:
+    """Check gh authentication and overlay repo access with a single gh call.
+
+    Returns:
+        Tuple of (authenticated, can_access_overlay)
+    """
+    # gh exits non-zero when the repository is null but still prints the
+    # JSON response, so parse stdout regardless of the return code
+    _, stdout, _ = run_command(["gh", "api", "graphql", "-f", f"query={GH_ACCESS_QUERY}"])
+    try:
+        data = json.loads(stdout).get("data") or {}
+    except (json.JSONDecodeError, AttributeError):
+        return False, False
+    authenticated = bool((data.get("viewer") or {}).get("login"))
+    return authenticated, authenticated and data.get("repository") is not None
+
+
+def run_probes(probes: dict[str, Callable[[], Any]]) -> dict[str, Any]:
+    """Run independent probes concurrently and return results by name.
+
+    Probes are dominated by subprocess wait time, so threads overlap them.
+    """
+    if len(probes) <= 1:
+        # Nothing to overlap; skip the pool and its thread startup
+        return {name: probe() for name, probe in probes.items()}
+    # Deferred: only status/doctor probe, and concurrent.futures is a heavy import
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = {name: pool.submit(probe) for name, probe in probes.items()}
+    return {name: future.result() for name, future in futures.items()}
+
+
 # =============================================================================
 # Status/Orientation Command
 # =============================================================================
 
+STATUS_CACHE_FILE = "status-cache.json"
+DEFAULT_STATUS_MAX_AGE = 5.0
+
+
+def _config_stamp() -> dict[str, Any]:
+    """Everything besides cwd that decides which repos status reports.
+
+    That is the (mtime_ns, size) of the user and project config files (None
+    where missing) and the env vars that override repo discovery.
+    """
+    files: list[Optional[list[int]]] = []
+    for path in (get_user_config_path(), get_project_config_path()):
+        try:
+            stat = path.stat()
+        except OSError:
+            files.append(None)
+        else:
+            files.append([stat.st_mtime_ns, stat.st_size])
+    return {"files": files, "env": repo_discovery_env()}
+
+
+def load_status_cache(max_age: float) -> Optional[dict]:
+    """Load the last status result if it is fresh and was taken from this directory.
+
+    A result saved before the config files or repo env overrides changed is
+    treated as stale.
+
+    Returns:
+        Dict with "data" and "next_steps", or None if missing or stale.
+    """
+    path = get_data_dir() / STATUS_CACHE_FILE
+    try:
+        if time.time() - path.stat().st_mtime > max_age:
+            return None
+        cached = json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(cached, dict) or "data" not in cached or "next_steps" not in cached:
+        return None
+    if cached.get("cwd") != str(Path.cwd()) or cached.get("config") != _config_stamp():
+        return None
+    return cached
+
+
+def save_status_cache(data: dict, next_steps: list[str]) -> None:
+    """Save a status result atomically for later `status --quick` calls."""
+    data_dir = get_data_dir()
+    cached = {
+        "cwd": str(Path.cwd()),
+        "config": _config_stamp(),
+        "data": data,
+        "next_steps": next_steps,
+    }
+    try:
+        data_dir.mkdir(parents=True, exist_ok=True)
+        write_file_atomic(data_dir / STATUS_CACHE_FILE, json.dumps(cached, default=str))
+    except OSError:
+        pass
+
 
-def cmd_status(fmt: OutputFormatter, _args: argparse.Namespace) -> int:
+TOOLS_SKIPPED_MESSAGE = "Tools: not checked until a repo is configured (use --full)"
+
+# Human labels for tool checks whose JSON name differs
+_TOOL_LABELS = {"gh_cli": "gh CLI", "container_runtime": "container runtime"}
+
+
+def _render_cached_status(fmt: OutputFormatter, data: dict, next_steps: list[str]) -> None:
+    """Replay a cached status result with the same sections and icons as a live run."""
+    fmt.header("RHDH Plugin Environment")
+    log_by_status = {
+        "pass": fmt.log_ok,
+        "warn": fmt.log_warn,
+        "fail": fmt.log_fail,
+        "info": fmt.log_info,
+    }
+    repo_keys = {info["config_key"] for info in SUBMODULE_REPOS.values()}
+    tools_checked = False
+    for check in data.get("checks", []):
+        name = check.get("name", "unknown")
+        if name not in repo_keys and not tools_checked:
+            fmt.header("Tools")
+            tools_checked = True
+        log = log_by_status.get(check.get("status"), fmt.log_info)
+        log(f"{_TOOL_LABELS.get(name, name)}: {check.get('message', '')}")
+
+    if not tools_checked:
+        fmt.log_info(TOOLS_SKIPPED_MESSAGE)
+    elif data.get("needs_setup"):
+        fmt.render_banner("Configuration needed. Run:", call_to_action="rhdh doctor")
+    fmt.success(data, next_steps=next_steps)
+
+
+def cmd_status(fmt: OutputFormatter, args: argparse.Namespace) -> int:
     """Show environment status (orientation).
 
     Returns structured data with needs_setup flag for agentic use.
     """
+    if getattr(args, "quick", False):
+        cached = load_status_cache(args.max_age)
+        if cached:
+            _render_cached_status(fmt, cached["data"], cached["next_steps"])
+            return 0
+
     fmt.header("RHDH Plugin Environment")
 
     checks: list[dict[str, Any]] = []
     next_steps: list[str] = []
     needs_setup = False
 
-    # Check all configured repos
-    for info in SUBMODULE_REPOS.values():
-        config_key = info["config_key"]
-        required = info["required"]
-        repo_path = get_repo(config_key)
+    repos = [
+        (info["config_key"], info["required"], get_repo(info["config_key"]))
+        for info in SUBMODULE_REPOS.values()
+    ]
+
+    # With no repos configured the only useful advice is to set one up, so
+    # skip the tool probes unless --full asks for them
+    skip_tools = not getattr(args, "full", False) and not any(path for _, _, path in repos)
+
+    has_gh = not skip_tools and check_tool("gh")
+    has_podman = not skip_tools and check_tool("podman")
+    has_docker = not skip_tools and not has_podman and check_tool("docker")
+    has_jira = not skip_tools and check_tool("jira")
+
+    # Probe repos and tools concurrently, then render in a fixed order
+    probes: dict[str, Callable[[], Any]] = {
+        f"repo:{config_key}": partial(get_repo_snapshot, repo_path)
+        for config_key, _, repo_path in repos
+        if repo_path
+    }
+    if has_gh:
+        probes["gh_auth"] = partial(run_command_rc_only, ["gh", "auth", "status"])
+    if has_podman:
+        probes["runtime_version"] = partial(run_command, ["podman", "--version"])
+    elif has_docker:
+        probes["runtime_version"] = partial(run_command, ["docker", "--version"])
+    if has_jira:
+        probes["jira_auth"] = partial(run_command, ["jira", "me"])
+    results = run_probes(probes)
 
+    # Check all configured repos
+    for config_key, required, repo_path in repos:
         if repo_path:
-            branch = get_git_branch(repo_path)
-            status = "uncommitted" if has_uncommitted_changes(repo_path) else "clean"
+            branch, is_clean, _ = results[f"repo:{config_key}"]
+            status = "clean" if is_clean else "uncommitted"
             checks.append(
                 {
                     "name": config_key,
@@ -136,12 +354,19 @@ def cmd_status(fmt: OutputFormatter, _args: argparse.Namespace) -> int:
             )
             fmt.log_info(f"{config_key}: not configured (optional)")
 
+    if skip_tools:
+        fmt.log_info(TOOLS_SKIPPED_MESSAGE)
+        data = {"needs_setup": needs_setup, "checks": checks}
+        next_steps = ["rhdh setup submodule list", "rhdh status --full"]
+        save_status_cache(data, next_steps)
+        fmt.success(data, next_steps=next_steps)
+        return 0
+
     # Check tools
     fmt.header("Tools")
 
-    if check_tool("gh"):
-        rc, _, _ = run_command(["gh", "auth", "status"])
-        if rc == 0:
+    if has_gh:
+        if results["gh_auth"] == 0:
             checks.append({"name": "gh_cli", "status": "pass", "message": "authenticated"})
             fmt.log_ok("gh CLI: authenticated")
         else:
@@ -153,13 +378,13 @@ def cmd_status(fmt: OutputFormatter, _args: argparse.Namespace) -> int:
         fmt.log_fail("gh CLI: not installed")
         next_steps.append("Install gh CLI: https://cli.github.com/")
 
-    if check_tool("podman"):
-        rc, stdout, _ = run_command(["podman", "--version"])
+    if has_podman:
+        rc, stdout, _ = results["runtime_version"]
         version = stdout.strip() if rc == 0 else "unknown"
         checks.append({"name": "podman", "status": "pass", "message": version})
         fmt.log_ok(f"podman: {version}")
-    elif check_tool("docker"):
-        rc, stdout, _ = run_command(["docker", "--version"])
+    elif has_docker:
+        rc, stdout, _ = results["runtime_version"]
         version = stdout.strip() if rc == 0 else "unknown"
         checks.append({"name": "docker", "status": "pass", "message": version})
         fmt.log_ok(f"docker: {version}")
@@ -174,8 +399,8 @@ def cmd_status(fmt: OutputFormatter, _args: argparse.Namespace) -> int:
         checks.append({"name": "jq", "status": "warn", "message": "not installed"})
         fmt.log_warn("jq: not installed (recommended)")
 
-    if check_tool("jira"):
-        rc, _, _ = run_command(["jira", "me"])
+    if has_jira:
+        rc, _, _ = results["jira_auth"]
         if rc == 0:
             checks.append({"name": "jira", "status": "pass", "message": "authenticated"})
             fmt.log_ok("jira: authenticated")
@@ -218,6 +443,7 @@ def cmd_status(fmt: OutputFormatter, _args: argparse.Namespace) -> int:
             ]
         )
 
+    save_status_cache(data, next_steps)
     fmt.success(data, next_steps=next_steps)
     return 0
 
@@ -234,19 +460,42 @@ def cmd_doctor(fmt: OutputFormatter, _args: argparse.Namespace) -> int:
     checks: list[dict[str, Any]] = []
     issues: list[str] = []
 
-    # Check all repos
-    for info in SUBMODULE_REPOS.values():
-        config_key = info["config_key"]
-        required = info["required"]
-        repo_path = get_repo(config_key)
+    repos = [
+        (info["config_key"], info["required"], get_repo(info["config_key"]))
+        for info in SUBMODULE_REPOS.values()
+    ]
+    has_gh = check_tool("gh")
+    has_podman = check_tool("podman")
+    has_docker = not has_podman and check_tool("docker")
+    has_jira = check_tool("jira")
+
+    # Probe repos and tools concurrently, then render in a fixed order
+    probes: dict[str, Callable[[], Any]] = {
+        f"repo:{config_key}": partial(
+            run_command_rc_only, ["git", "rev-parse", "--git-dir"], cwd=repo_path
+        )
+        for config_key, _, repo_path in repos
+        if repo_path
+    }
+    if has_gh:
+        probes["gh_access"] = check_gh_access
+    if has_podman:
+        # Only the return code matters; let podman filter so it lists next to nothing
+        probes["podman_running"] = partial(
+            run_command_rc_only, ["podman", "ps", "--quiet", "--filter", "name=rhdh"]
+        )
+    if has_jira:
+        probes["jira_auth"] = partial(run_command, ["jira", "me"])
+    results = run_probes(probes)
 
+    # Check all repos
+    for config_key, required, repo_path in repos:
         if repo_path:
             checks.append({"name": config_key, "status": "pass", "message": str(repo_path)})
             fmt.log_ok(f"{config_key} found: {repo_path}")
 
             # Check it's a git repo
-            rc, _, _ = run_command(["git", "rev-parse", "--git-dir"], cwd=repo_path)
-            if rc == 0:
+            if results[f"repo:{config_key}"] == 0:
                 checks.append({"name": f"{config_key}_git", "status": "pass", "message": "valid"})
                 fmt.log_ok("  Git repository valid")
             else:
@@ -265,20 +514,17 @@ def cmd_doctor(fmt: OutputFormatter, _args: argparse.Namespace) -> int:
 
     fmt.header("GitHub CLI")
 
-    if check_tool("gh"):
+    if has_gh:
         checks.append({"name": "gh_installed", "status": "pass", "message": "installed"})
         fmt.log_ok("gh CLI installed")
 
-        rc, _, _ = run_command(["gh", "auth", "status"])
-        if rc == 0:
+        authenticated, can_access_overlay = results["gh_access"]
+        if authenticated:
             checks.append({"name": "gh_auth", "status": "pass", "message": "authenticated"})
             fmt.log_ok("  Authenticated")
 
             # Check repo access
-            rc, _, _ = run_command(
-                ["gh", "api", "repos/redhat-developer/rhdh-plugin-export-overlays", "--silent"]
-            )
-            if rc == 0:
+            if can_access_overlay:
                 checks.append(
                     {"name": "gh_access", "status": "pass", "message": "can access overlay repo"}
                 )
@@ -299,18 +545,17 @@ def cmd_doctor(fmt: OutputFormatter, _args: argparse.Namespace) -> int:
 
     fmt.header("Container Runtime")
 
-    if check_tool("podman"):
+    if has_podman:
         checks.append({"name": "podman", "status": "pass", "message": "installed"})
         fmt.log_ok("podman installed")
 
-        rc, _, _ = run_command(["podman", "ps"])
-        if rc == 0:
+        if results["podman_running"] == 0:
             checks.append({"name": "podman_running", "status": "pass", "message": "running"})
             fmt.log_ok("  Podman running")
         else:
             checks.append({"name": "podman_running", "status": "warn", "message": "not running"})
             fmt.log_warn("  Podman not running or not accessible")
-    elif check_tool("docker"):
+    elif has_docker:
         checks.append({"name": "docker", "status": "pass", "message": "installed"})
         fmt.log_ok("docker installed")
     else:
@@ -321,11 +566,11 @@ def cmd_doctor(fmt: OutputFormatter, _args: argparse.Namespace) -> int:
     # JIRA CLI (optional)
     fmt.header("JIRA CLI")
 
-    if check_tool("jira"):
+    if has_jira:
         checks.append({"name": "jira_installed", "status": "pass", "message": "installed"})
         fmt.log_ok("jira CLI installed")
 
-        rc, _, _ = run_command(["jira", "me"])
+        rc, _, _ = results["jira_auth"]
         if rc == 0:
             checks.append({"name": "jira_auth", "status": "pass", "message": "authenticated"})
             fmt.log_ok("  Authenticated")
@@ -360,7 +605,8 @@ def cmd_doctor(fmt: OutputFormatter, _args: argparse.Namespace) -> int:
 
         # Check rhdh-local is present inside it
         local_dir = local_setup / "rhdh-local"
-        if local_dir.is_dir():
+        has_local_dir = local_dir.is_dir()
+        if has_local_dir:
             checks.append(
                 {"name": "local_setup_rhdh_local", "status": "pass", "message": str(local_dir)}
             )
@@ -383,7 +629,7 @@ def cmd_doctor(fmt: OutputFormatter, _args: argparse.Namespace) -> int:
             fmt.log_warn(f"  rhdh-customizations not found inside {local_setup}")
 
         # Check if customizations are synced (only meaningful when rhdh-local exists)
-        if local_dir.is_dir():
+        if has_local_dir:
             override_yaml = (
                 local_dir / "configs" / "dynamic-plugins" / "dynamic-plugins.override.yaml"
             )
@@ -463,23 +709,6 @@ def cmd_doctor(fmt: OutputFormatter, _args: argparse.Namespace) -> int:
     return 0 if all_passed else 1
 
 
-# =============================================================================
-# Local Commands — thin delegation to rhdh_local.cli
-# =============================================================================
-
-from rhdh_local.cli import (  # noqa: E402
-    cmd_local_apply,
-    cmd_local_backup,
-    cmd_local_backup_list,
-    cmd_local_down,
-    cmd_local_health,
-    cmd_local_plugins_list,
-    cmd_local_remove,
-    cmd_local_restore,
-    cmd_local_status,
-    cmd_local_up,
-)
-
 # =============================================================================
 # Config Commands
 # =============================================================================
@@ -489,8 +718,8 @@ def cmd_config_init(fmt: OutputFormatter, args: argparse.Namespace) -> int:
     """Initialize configuration file."""
     from .config import run_config
 
-    force = getattr(args, "force", False)
-    global_ = getattr(args, "global_", False)
+    force = args.force
+    global_ = args.global_
     scope = "user" if global_ else "project"
 
     fmt.header(f"Initializing {scope.title()} Configuration")
@@ -518,7 +747,7 @@ def cmd_config_show(fmt: OutputFormatter, args: argparse.Namespace) -> int:
     """Show current configuration."""
     from .config import run_config
 
-    global_ = getattr(args, "global_", False)
+    global_ = args.global_
 
     fmt.header("Configuration")
 
@@ -551,7 +780,7 @@ def cmd_config_keys(fmt: OutputFormatter, args: argparse.Namespace) -> int:
     """List all config keys."""
     from .config import run_config
 
-    global_ = getattr(args, "global_", False)
+    global_ = args.global_
 
     success, data, next_steps = run_config("keys", global_=global_)
 
@@ -572,7 +801,7 @@ def cmd_config_get(fmt: OutputFormatter, args: argparse.Namespace) -> int:
     """Get a config value."""
     from .config import run_config
 
-    key = getattr(args, "key", None)
+    key = args.key
 
     success, data, next_steps = run_config("get", key=key)
 
@@ -589,9 +818,9 @@ def cmd_config_set(fmt: OutputFormatter, args: argparse.Namespace) -> int:
     """Set a config value."""
     from .config import run_config
 
-    key = getattr(args, "key", None)
-    value = getattr(args, "value", None)
-    global_ = getattr(args, "global_", False)
+    key = args.key
+    value = args.value
+    global_ = args.global_
 
     success, data, next_steps = run_config("set", key=key, value=value, global_=global_)
 
@@ -620,8 +849,6 @@ def cmd_setup_submodule_list(fmt: OutputFormatter, _args: argparse.Namespace) ->
     # Check if any repos need username
     needs_username = any(r.get("needs_username") for r in repos)
 
-    from .formatters import BLUE, GREEN, NC, RED, YELLOW
-
     # Show GitHub username status
     if github_username:
         fmt.log_info(f"GitHub user: {BLUE}{github_username}{NC}")
@@ -646,16 +873,15 @@ def cmd_setup_submodule_list(fmt: OutputFormatter, _args: argparse.Namespace) ->
             color = RED if repo["required"] else YELLOW
             status_text = "✗ not configured"
 
-        lines = [f"{color}{repo['name']:<35}{NC} {status_text}{required}"]
-        lines.append(f"    {repo['description']}")
+        out = f"{color}{repo['name']:<35}{NC} {status_text}{required}\n    {repo['description']}"
         if repo["path"]:
-            lines.append(f"    Path: {repo['path']}")
+            out += f"\n    Path: {repo['path']}"
         if repo.get("has_fork"):
             if repo.get("origin"):
-                lines.append(f"    Fork: {repo['origin']}")
+                out += f"\n    Fork: {repo['origin']}"
             else:
-                lines.append(f"    {YELLOW}Fork: requires GitHub username{NC}")
-        return "\n".join(lines)
+                out += f"\n    {YELLOW}Fork: requires GitHub username{NC}"
+        return out
 
     fmt.render_list(repos, format_repo)
 
@@ -664,17 +890,19 @@ def cmd_setup_submodule_list(fmt: OutputFormatter, _args: argparse.Namespace) ->
         "repos": repos,
     }
 
-    # Determine next steps based on status
-    unconfigured_required = [r for r in repos if r["status"] == "not_configured" and r["required"]]
+    # Determine next steps based on status; only the first missing required repo is named
+    first_unconfigured = next(
+        (r["name"] for r in repos if r["status"] == "not_configured" and r["required"]), None
+    )
     if needs_username and not github_username:
         next_steps = [
             "gh auth login",
             "rhdh config set github.username <your-username>",
         ]
-    elif unconfigured_required:
+    elif first_unconfigured:
         next_steps = [
             "rhdh setup submodule add --all",
-            f"rhdh setup submodule add {unconfigured_required[0]['name']}",
+            f"rhdh setup submodule add {first_unconfigured}",
         ]
     else:
         next_steps = ["rhdh", "rhdh workspace list"]
@@ -685,9 +913,9 @@ def cmd_setup_submodule_list(fmt: OutputFormatter, _args: argparse.Namespace) ->
 
 def cmd_setup_submodule_add(fmt: OutputFormatter, args: argparse.Namespace) -> int:
     """Add repository as submodule."""
-    add_all = getattr(args, "all", False)
-    name = getattr(args, "name", None)
-    dry_run = getattr(args, "dry_run", False)
+    add_all = args.all
+    name = args.name
+    dry_run = args.dry_run
 
     # Detect GitHub username (needed for repos with forks)
     github_username = get_github_username()
@@ -702,14 +930,13 @@ def cmd_setup_submodule_add(fmt: OutputFormatter, args: argparse.Namespace) -> i
 
         results = []
         all_success = True
+        # Every repo lands in the same project, so only look up its root once
+        git_root = find_git_root()
 
-        for repo_name, repo_info in SUBMODULE_REPOS.items():
-            if not repo_info["required"]:
-                continue
-
+        for repo_name in REQUIRED_SUBMODULE_REPOS:
             fmt.log_info(f"Setting up: {repo_name}")
             success, data, _ = setup_submodule(
-                repo_name, dry_run=dry_run, github_username=github_username
+                repo_name, dry_run=dry_run, github_username=github_username, git_root=git_root
             )
 
             if success:
@@ -783,9 +1010,12 @@ def cmd_setup_submodule_add(fmt: OutputFormatter, args: argparse.Namespace) -> i
 # =============================================================================
 
 
-def cmd_workspace_list(fmt: OutputFormatter, _args: argparse.Namespace) -> int:
+def cmd_workspace_list(fmt: OutputFormatter, args: argparse.Namespace) -> int:
     """List plugin workspaces."""
-    overlay_repo, workspaces = list_workspaces()
+    from .workspace import list_workspaces
+
+    names_only = args.names_only
+    overlay_repo, workspaces = list_workspaces(names_only=names_only)
 
     if overlay_repo is None:
         fmt.error(
@@ -798,25 +1028,36 @@ def cmd_workspace_list(fmt: OutputFormatter, _args: argparse.Namespace) -> int:
     fmt.header("Plugin Workspaces")
     fmt.log_info(f"Location: {overlay_repo}/workspaces/")
 
-    items = []
-    for ws in workspaces:
-        items.append(
+    if not workspaces:
+        fmt.log_info("No workspaces found")
+        fmt.success(
+            {"overlay_repo": str(overlay_repo), "count": 0, "items": []},
+            next_steps=["rhdh doctor"],
+        )
+        return 0
+
+    if names_only:
+        items = [{"name": name} for name in workspaces]
+        fmt.render_list(
+            items, lambda i: f"{BLUE}{i['name']}{NC}", summary=f"Total: {len(items)} workspaces"
+        )
+    else:
+        items = [
             {
                 "name": ws.name,
                 "detail": ws.repo_ref or "(no source.json)",
                 "repo": ws.repo,
                 "repo_ref": ws.repo_ref,
             }
-        )
-
-    # Render items in human mode
-    from .formatters import BLUE, NC
+            for ws in workspaces
+        ]
 
-    fmt.render_list(
-        items,
-        lambda i: f"{BLUE}{i['name']:<30}{NC} {i['detail']}",
-        summary=f"Total: {len(items)} workspaces",
-    )
+        # Render items in human mode
+        fmt.render_list(
+            items,
+            lambda i: f"{BLUE}{i['name']:<30}{NC} {i['detail']}",
+            summary=f"Total: {len(items)} workspaces",
+        )
 
     data = {
         "overlay_repo": str(overlay_repo),
@@ -830,9 +1071,12 @@ def cmd_workspace_list(fmt: OutputFormatter, _args: argparse.Namespace) -> int:
 
 def cmd_workspace_status(fmt: OutputFormatter, args: argparse.Namespace) -> int:
     """Show workspace details."""
-    found, ws, error = get_workspace(args.name)
+    from .workspace import get_workspace
 
-    if not found:
+    _, ws, error = get_workspace(args.name)
+
+    # get_workspace returns a workspace exactly when it was found
+    if ws is None:
         fmt.error(
             "WORKSPACE_NOT_FOUND",
             error,
@@ -840,8 +1084,6 @@ def cmd_workspace_status(fmt: OutputFormatter, args: argparse.Namespace) -> int:
         )
         return 1
 
-    assert ws is not None  # Type narrowing
-
     fmt.header(f"Workspace: {ws.name}")
 
     # Files check
@@ -883,6 +1125,9 @@ def cmd_workspace_status(fmt: OutputFormatter, args: argparse.Namespace) -> int:
 
 def cmd_log_add(fmt: OutputFormatter, args: argparse.Namespace) -> int:
     """Add a worklog entry."""
+    from .worklog import add_entry as worklog_add_entry
+    from .worklog import format_entry_human
+
     message = args.message
     tags = args.tag if args.tag else None
 
@@ -898,6 +1143,8 @@ def cmd_log_add(fmt: OutputFormatter, args: argparse.Namespace) -> int:
 
 def cmd_log_show(fmt: OutputFormatter, args: argparse.Namespace) -> int:
     """Show recent worklog entries."""
+    from .worklog import format_entries_human, read_entries
+
     limit = args.limit
     since = args.since
 
@@ -913,11 +1160,7 @@ def cmd_log_show(fmt: OutputFormatter, args: argparse.Namespace) -> int:
 
     fmt.header("Worklog")
 
-    fmt.render_list(
-        entries,
-        lambda e: format_entry_human(e),
-        summary=f"Showing {len(entries)} entries",
-    )
+    fmt.render_lines(format_entries_human(entries), summary=f"Showing {len(entries)} entries")
 
     fmt.success(
         {"count": len(entries), "entries": entries},
@@ -928,6 +1171,8 @@ def cmd_log_show(fmt: OutputFormatter, args: argparse.Namespace) -> int:
 
 def cmd_log_search(fmt: OutputFormatter, args: argparse.Namespace) -> int:
     """Search worklog entries."""
+    from .worklog import format_entries_human, search_entries
+
     query = args.query
     limit = args.limit
 
@@ -943,11 +1188,7 @@ def cmd_log_search(fmt: OutputFormatter, args: argparse.Namespace) -> int:
 
     fmt.header(f"Search: {query}")
 
-    fmt.render_list(
-        matches,
-        lambda e: format_entry_human(e),
-        summary=f"Found {len(matches)} matches",
-    )
+    fmt.render_lines(format_entries_human(matches), summary=f"Found {len(matches)} matches")
 
     fmt.success(
         {"query": query, "count": len(matches), "entries": matches},
@@ -963,6 +1204,8 @@ def cmd_log_search(fmt: OutputFormatter, args: argparse.Namespace) -> int:
 
 def cmd_todo_add(fmt: OutputFormatter, args: argparse.Namespace) -> int:
     """Add a new todo item."""
+    from .todo import add_todo
+
     title = args.title
     context = args.context
 
@@ -984,6 +1227,8 @@ def cmd_todo_add(fmt: OutputFormatter, args: argparse.Namespace) -> int:
 
 def cmd_todo_list(fmt: OutputFormatter, args: argparse.Namespace) -> int:
     """List todo items."""
+    from .todo import list_todos
+
     include_done = not args.pending
 
     todos = list_todos(include_done=include_done)
@@ -998,11 +1243,12 @@ def cmd_todo_list(fmt: OutputFormatter, args: argparse.Namespace) -> int:
 
     fmt.header("Todos")
 
-    from .formatters import GREEN, NC, YELLOW
-
-    items = []
+    items: list[dict] = []
+    add_item = items.append
+    done = 0
     for todo in todos:
-        items.append(
+        done += todo.done
+        add_item(
             {
                 "slug": todo.slug,
                 "title": todo.title,
@@ -1011,15 +1257,16 @@ def cmd_todo_list(fmt: OutputFormatter, args: argparse.Namespace) -> int:
                 "context": todo.context,
             }
         )
+    pending = len(todos) - done
+
+    done_mark = f"{GREEN}[x]{NC} "
+    pending_mark = f"{YELLOW}[ ]{NC} "
 
     def format_todo(item: dict) -> str:
-        status = "[x]" if item["done"] else "[ ]"
-        color = GREEN if item["done"] else YELLOW
+        mark = done_mark if item["done"] else pending_mark
         context_str = f" ({item['context']})" if item["context"] else ""
-        return f"{color}{status}{NC} {item['title']}{context_str}\n      slug: {item['slug']}"
+        return f"{mark}{item['title']}{context_str}\n      slug: {item['slug']}"
 
-    pending = sum(1 for t in todos if not t.done)
-    done = sum(1 for t in todos if t.done)
     fmt.render_list(items, format_todo, summary=f"{pending} pending, {done} done")
 
     fmt.success(
@@ -1031,6 +1278,8 @@ def cmd_todo_list(fmt: OutputFormatter, args: argparse.Namespace) -> int:
 
 def cmd_todo_done(fmt: OutputFormatter, args: argparse.Namespace) -> int:
     """Mark a todo as done."""
+    from .todo import mark_done
+
     slug = args.slug
 
     todo = mark_done(slug)
@@ -1057,6 +1306,8 @@ def cmd_todo_done(fmt: OutputFormatter, args: argparse.Namespace) -> int:
 
 def cmd_todo_note(fmt: OutputFormatter, args: argparse.Namespace) -> int:
     """Add a note to a todo."""
+    from .todo import add_note as todo_add_note
+
     slug = args.slug
     note = args.note
 
@@ -1080,6 +1331,9 @@ def cmd_todo_note(fmt: OutputFormatter, args: argparse.Namespace) -> int:
 
 def cmd_todo_show(fmt: OutputFormatter, _args: argparse.Namespace) -> int:
     """Show the raw TODO.md file."""
+    from .todo import get_todo_file_path
+    from .todo import show_raw as todo_show_raw
+
     content = todo_show_raw()
     file_path = get_todo_file_path()
 
@@ -1100,74 +1354,35 @@ def cmd_todo_show(fmt: OutputFormatter, _args: argparse.Namespace) -> int:
 # =============================================================================
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create the argument parser."""
-    parser = argparse.ArgumentParser(
-        prog="rhdh",
-        description="CLI helper for RHDH plugin management",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""\
-OUTPUT FORMAT:
-    Auto-detected: JSON when piped (for Claude), human-readable in terminal.
-    Override with --json or --human flags.
-
-ENVIRONMENT VARIABLES:
-    RHDH_OVERLAY_REPO   Path to rhdh-plugin-export-overlays
-    RHDH_LOCAL_REPO     Path to rhdh-local
-    RHDH_FACTORY_REPO   Path to rhdh-dynamic-plugin-factory
-
-EXAMPLES:
-    rhdh                           # Show status (orientation)
-    rhdh doctor                    # Check setup
-    rhdh config init               # Create config
-    rhdh workspace list            # List workspaces
-    rhdh --json workspace list     # Force JSON output
-
-    # Worklog
-    rhdh log add "Started onboarding aws-appsync" --tag onboard
-    rhdh log show --limit 10
-    rhdh log search "aws"
-
-    # Todos
-    rhdh todo add "Check license with legal" --context aws-appsync
-    rhdh todo list
-    rhdh todo done check-license
-    rhdh todo note check-license "Sent email to legal@"
-    rhdh todo show
-""",
-    )
-    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
-
-    # Output format flags
-    format_group = parser.add_mutually_exclusive_group()
-    format_group.add_argument(
-        "--json",
+def _build_status(status_parser: argparse.ArgumentParser) -> None:
+    """Register the status command (also the default when no command is given)."""
+    status_parser.add_argument(
+        "--full",
         action="store_true",
-        help="Force JSON output (default when piped)",
+        help="Check tools even when no repos are configured",
     )
-    format_group.add_argument(
-        "--human",
+    status_parser.add_argument(
+        "--quick",
         action="store_true",
-        help="Force human-readable output (default in terminal)",
+        help="Reuse the last status result if it is recent enough",
     )
-    parser.add_argument(
-        "--verbose",
-        action="store_true",
-        help="Include debug information",
+    status_parser.add_argument(
+        "--max-age",
+        type=float,
+        default=DEFAULT_STATUS_MAX_AGE,
+        metavar="SECONDS",
+        help=f"Oldest result --quick will reuse (default: {DEFAULT_STATUS_MAX_AGE:g})",
     )
-
-    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
-
-    # Status (also default when no command)
-    status_parser = subparsers.add_parser("status", help="Show environment status")
     status_parser.set_defaults(func=cmd_status)
 
-    # Doctor
-    doctor_parser = subparsers.add_parser("doctor", help="Full environment check")
+
+def _build_doctor(doctor_parser: argparse.ArgumentParser) -> None:
+    """Register the doctor command."""
     doctor_parser.set_defaults(func=cmd_doctor)
 
-    # Config
-    config_parser = subparsers.add_parser("config", help="Configuration management")
+
+def _build_config(config_parser: argparse.ArgumentParser) -> None:
+    """Register config subcommands."""
     config_subparsers = config_parser.add_subparsers(dest="config_command", metavar="SUBCOMMAND")
 
     # config init
@@ -1216,8 +1431,9 @@ EXAMPLES:
     )
     config_set_parser.set_defaults(func=cmd_config_set)
 
-    # Setup
-    setup_parser = subparsers.add_parser("setup", help="Environment setup commands")
+
+def _build_setup(setup_parser: argparse.ArgumentParser) -> None:
+    """Register setup subcommands."""
     setup_subparsers = setup_parser.add_subparsers(dest="setup_command", metavar="SUBCOMMAND")
 
     # setup submodule
@@ -1250,13 +1466,19 @@ EXAMPLES:
     )
     submodule_add_parser.set_defaults(func=cmd_setup_submodule_add)
 
-    # Workspace
-    workspace_parser = subparsers.add_parser("workspace", help="Workspace operations")
+
+def _build_workspace(workspace_parser: argparse.ArgumentParser) -> None:
+    """Register workspace subcommands."""
     workspace_subparsers = workspace_parser.add_subparsers(
         dest="workspace_command", metavar="SUBCOMMAND"
     )
 
     workspace_list_parser = workspace_subparsers.add_parser("list", help="List plugin workspaces")
+    workspace_list_parser.add_argument(
+        "--names-only",
+        action="store_true",
+        help="List workspace names without reading their source.json",
+    )
     workspace_list_parser.set_defaults(func=cmd_workspace_list)
 
     workspace_status_parser = workspace_subparsers.add_parser(
@@ -1265,8 +1487,9 @@ EXAMPLES:
     workspace_status_parser.add_argument("name", help="Workspace name")
     workspace_status_parser.set_defaults(func=cmd_workspace_status)
 
-    # Log (worklog)
-    log_parser = subparsers.add_parser("log", help="Worklog operations")
+
+def _build_log(log_parser: argparse.ArgumentParser) -> None:
+    """Register worklog subcommands."""
     log_subparsers = log_parser.add_subparsers(dest="log_command", metavar="SUBCOMMAND")
 
     log_add_parser = log_subparsers.add_parser("add", help="Add a worklog entry")
@@ -1286,8 +1509,9 @@ EXAMPLES:
     log_search_parser.add_argument("--limit", "-n", type=int, help="Max results")
     log_search_parser.set_defaults(func=cmd_log_search)
 
-    # Todo
-    todo_parser = subparsers.add_parser("todo", help="Todo operations")
+
+def _build_todo(todo_parser: argparse.ArgumentParser) -> None:
+    """Register todo subcommands."""
     todo_subparsers = todo_parser.add_subparsers(dest="todo_command", metavar="SUBCOMMAND")
 
     todo_add_parser = todo_subparsers.add_parser("add", help="Add a new todo")
@@ -1313,8 +1537,24 @@ EXAMPLES:
     todo_show_parser = todo_subparsers.add_parser("show", help="Show raw TODO.md")
     todo_show_parser.set_defaults(func=cmd_todo_show)
 
-    # Local (rhdh-local-setup customization system)
-    local_parser = subparsers.add_parser("local", help="Local RHDH customization operations")
+
+def _build_local(local_parser: argparse.ArgumentParser) -> None:
+    """Register local (rhdh-local-setup customization system) subcommands."""
+    # The handlers are thin delegations to rhdh_local, which is only imported
+    # when a local command is actually parsed
+    from rhdh_local.cli import (
+        cmd_local_apply,
+        cmd_local_backup,
+        cmd_local_backup_list,
+        cmd_local_down,
+        cmd_local_health,
+        cmd_local_plugins_list,
+        cmd_local_remove,
+        cmd_local_restore,
+        cmd_local_status,
+        cmd_local_up,
+    )
+
     local_subparsers = local_parser.add_subparsers(dest="local_command", metavar="SUBCOMMAND")
 
     # local status
@@ -1430,6 +1670,111 @@ EXAMPLES:
     local_restore_parser.add_argument("--force", action="store_true", help=argparse.SUPPRESS)
     local_restore_parser.set_defaults(func=cmd_local_restore)
 
+
+# Top-level commands: name -> (help shown in `rhdh --help`, builder for its arguments)
+_COMMANDS: dict[str, tuple[str, Callable[[argparse.ArgumentParser], None]]] = {
+    "status": ("Show environment status", _build_status),
+    "doctor": ("Full environment check", _build_doctor),
+    "config": ("Configuration management", _build_config),
+    "setup": ("Environment setup commands", _build_setup),
+    "workspace": ("Workspace operations", _build_workspace),
+    "log": ("Worklog operations", _build_log),
+    "todo": ("Todo operations", _build_todo),
+    "local": ("Local RHDH customization operations", _build_local),
+}
+
+
+def _select_command(argv: list[str]) -> str:
+    """Pick the top-level command from argv without parsing it.
+
+    Returns "help" when only the command overview is needed (top-level help,
+    `rhdh help`, an unknown command, or `--version`, which argparse answers
+    before any subcommand is looked at).
+    """
+    for arg in argv:
+        if arg in ("-h", "--help", "--version"):
+            return "help"
+        if not arg.startswith("-"):
+            return arg if arg in _COMMANDS else "help"
+    # No command means status
+    return "status"
+
+
+def create_parser(only: str | None = None) -> argparse.ArgumentParser:
+    """Create the argument parser.
+
+    Args:
+        only: Register just this top-level command (see _select_command).
+            "help" registers every command with its help text but none of
+            their arguments, which is all the overview needs. None builds
+            every command in full.
+    """
+    parser = argparse.ArgumentParser(
+        prog="rhdh",
+        description="CLI helper for RHDH plugin management",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""\
+OUTPUT FORMAT:
+    Auto-detected: JSON when piped (for Claude), human-readable in terminal.
+    Override with --json or --human flags.
+
+ENVIRONMENT VARIABLES:
+    RHDH_OVERLAY_REPO   Path to rhdh-plugin-export-overlays
+    RHDH_LOCAL_REPO     Path to rhdh-local
+    RHDH_FACTORY_REPO   Path to rhdh-dynamic-plugin-factory
+
+EXAMPLES:
+    rhdh                           # Show status (orientation)
+    rhdh doctor                    # Check setup
+    rhdh config init               # Create config
+    rhdh workspace list            # List workspaces
+    rhdh --json workspace list     # Force JSON output
+
+    # Worklog
+    rhdh log add "Started onboarding aws-appsync" --tag onboard
+    rhdh log show --limit 10
+    rhdh log search "aws"
+
+    # Todos
+    rhdh todo add "Check license with legal" --context aws-appsync
+    rhdh todo list
+    rhdh todo done check-license
+    rhdh todo note check-license "Sent email to legal@"
+    rhdh todo show
+""",
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+
+    # Output format flags
+    format_group = parser.add_mutually_exclusive_group()
+    format_group.add_argument(
+        "--json",
+        action="store_true",
+        help="Force JSON output (default when piped)",
+    )
+    format_group.add_argument(
+        "--human",
+        action="store_true",
+        help="Force human-readable output (default in terminal)",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Include debug information",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+
+    if only in _COMMANDS:
+        help_text, build = _COMMANDS[only]
+        build(subparsers.add_parser(only, help=help_text))
+        return parser
+
+    for name, (help_text, build) in _COMMANDS.items():
+        command_parser = subparsers.add_parser(name, help=help_text)
+        if only is None:
+            build(command_parser)
+
     # Help command (for compatibility with bash version)
     help_parser = subparsers.add_parser("help", help="Show help")
     help_parser.set_defaults(func=lambda f, a: parser.print_help() or 0)
@@ -1437,6 +1782,12 @@ EXAMPLES:
     return parser
 
 
+@lru_cache(maxsize=None)
+def _cached_parser(only: str) -> argparse.ArgumentParser:
+    """Memoized create_parser(), so repeated main() calls in one process build it once."""
+    return create_parser(only=only)
+
+
 def main(argv: list[str] | None = None) -> int:
     """Main entry point.
 
@@ -1446,7 +1797,9 @@ def main(argv: list[str] | None = None) -> int:
     Returns:
         Exit code (0=success, 1=fixable, 2=critical)
     """
-    parser = create_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = _cached_parser(_select_command(argv))
     args = parser.parse_args(argv)
 
     # Determine output mode
@@ -1458,7 +1811,7 @@ def main(argv: list[str] | None = None) -> int:
         mode = "auto"  # Will auto-detect based on TTY
 
     # Create formatter
-    fmt = OutputFormatter(mode=mode, verbose=getattr(args, "verbose", False))
+    fmt = OutputFormatter(mode=mode, verbose=args.verbose)
 
     # No command = show status (orientation)
     if args.command is None:
@@ -1513,7 +1866,7 @@ def main(argv: list[str] | None = None) -> int:
         return 1
 
     # Local without subcommand
-    if args.command == "local" and getattr(args, "local_command", None) is None:
+    if args.command == "local" and args.local_command is None:
         fmt.error(
             "MISSING_SUBCOMMAND",
             "Local subcommand required",
@@ -1533,8 +1886,8 @@ def main(argv: list[str] | None = None) -> int:
     # Local plugins without subcommand
     if (
         args.command == "local"
-        and getattr(args, "local_command", None) == "plugins"
-        and getattr(args, "local_plugins_command", None) is None
+        and args.local_command == "plugins"
+        and args.local_plugins_command is None
     ):
         fmt.error(
             "MISSING_SUBCOMMAND",
@@ -1544,7 +1897,7 @@ def main(argv: list[str] | None = None) -> int:
         return 1
 
     # Setup without subcommand
-    if args.command == "setup" and getattr(args, "setup_command", None) is None:
+    if args.command == "setup" and args.setup_command is None:
         fmt.error(
             "MISSING_SUBCOMMAND",
             "Setup subcommand required",
@@ -1558,8 +1911,8 @@ def main(argv: list[str] | None = None) -> int:
     # Setup submodule without subcommand
     if (
         args.command == "setup"
-        and getattr(args, "setup_command", None) == "submodule"
-        and getattr(args, "submodule_command", None) is None
+        and args.setup_command == "submodule"
+        and args.submodule_command is None
     ):
         fmt.error(
             "MISSING_SUBCOMMAND",
@@ -1582,6 +1935,4 @@ def main(argv: list[str] | None = None) -> int:
 
 
 if __name__ == "__main__":
-    import sys
-
     sys.exit(main())
@@ -13,9 +13,10 @@ Supports dot-notation keys (e.g., repos.overlay, user.name).
 
 from __future__ import annotations
 
+import copy
 import json
 import os
-import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
@@ -111,12 +112,26 @@ SUBMODULE_REPOS: dict[str, dict] = {
     },
 }
 
+# Repos that `setup submodule add --all` sets up
+REQUIRED_SUBMODULE_REPOS: tuple[str, ...] = tuple(
+    name for name, info in SUBMODULE_REPOS.items() if info["required"]
+)
+
+# Shorthand keys for `config set` that expand to repos.<key>
+REPO_CONFIG_KEYS: frozenset[str] = frozenset(
+    [*(info["config_key"] for info in SUBMODULE_REPOS.values()), "local_setup"]
+)
+
 # GitHub organization for upstream repos
 GITHUB_ORG = "redhat-developer"
 
 # Submodule base directory (relative to git root)
 SUBMODULE_DIR = "repo"
 
+# Resolved repo paths per process, keyed by (config_key, env overrides...).
+# Cleared by config_invalidate_cache() whenever config is written.
+_repo_cache: dict[tuple[str | None, ...], Optional[Path]] = {}
+
 
 # =============================================================================
 # Path Discovery
@@ -124,17 +139,67 @@ SUBMODULE_DIR = "repo"
 
 
 def find_git_root() -> Path | None:
-    """Find the git repository root, or None if not in a repo."""
+    """Find the git repository root, or None if not in a repo.
+
+    Cached per working directory, since config loading asks for it repeatedly.
+    """
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--show-toplevel"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return Path(result.stdout.strip())
-    except (subprocess.CalledProcessError, FileNotFoundError):
+        cwd = os.getcwd()
+    except OSError:
         return None
+    return _git_root_for(cwd)
+
+
+@lru_cache(maxsize=None)
+def _git_root_for(cwd: str) -> Path | None:
+    """Walk up from cwd to the nearest directory with a .git entry, without running git.
+
+    Submodules and worktrees count too: their `.git` is a `gitdir: <path>` file.
+    """
+    path = Path(cwd)
+    for candidate in (path, *path.parents):
+        if find_git_dir(candidate) is not None:
+            return candidate
+    return None
+
+
+def find_git_dir(repo_path: Path) -> Path | None:
+    """Find a repo's git directory without running git.
+
+    Submodules and worktrees have a `.git` file containing `gitdir: <path>`
+    (relative to the repo) instead of a `.git` directory.
+    """
+    dot_git = repo_path / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    try:
+        content = dot_git.read_text().strip()
+    except OSError:
+        return None
+    if content.startswith("gitdir: "):
+        return (repo_path / content[len("gitdir: ") :]).resolve()
+    return None
+
+
+def get_remote_url(repo_path: Path, remote: str = "origin") -> str | None:
+    """Get a remote's URL by parsing the repo's git config without running git."""
+    git_dir = find_git_dir(repo_path)
+    if not git_dir:
+        return None
+    # Worktrees keep the shared config in the main repo's git dir
+    commondir = git_dir / "commondir"
+    if commondir.is_file():
+        git_dir = (git_dir / commondir.read_text().strip()).resolve()
+
+    # Only submodule setup reads remotes; keep configparser off the common import path
+    import configparser
+
+    parser = configparser.ConfigParser(strict=False, allow_no_value=True, interpolation=None)
+    try:
+        parser.read(git_dir / "config")
+    except configparser.Error:
+        return None
+    return parser.get(f'remote "{remote}"', "url", fallback=None)
 
 
 def get_project_config_dir() -> Path:
@@ -238,23 +303,30 @@ def collect_keys(data: dict, prefix: str = "") -> list[str]:
 
     Args:
         data: The config dictionary
-        prefix: Current path prefix
+        prefix: Path prefix for the top-level keys
 
     Returns:
-        List of all dot-notation paths
+        List of all dot-notation paths (unordered; callers sort as needed)
     """
     keys = []
-    for key, value in data.items():
-        full_key = f"{prefix}.{key}" if prefix else key
-        if isinstance(value, dict):
-            # Recurse into nested dict
-            keys.extend(collect_keys(value, full_key))
-        else:
-            # Leaf node
-            keys.append(full_key)
+    stack = [(prefix, data)]
+    while stack:
+        prefix, current = stack.pop()
+        for key, value in current.items():
+            full_key = f"{prefix}.{key}" if prefix else key
+            if isinstance(value, dict):
+                # Descend into nested dict on a later pass
+                stack.append((full_key, value))
+            else:
+                # Leaf node
+                keys.append(full_key)
     return keys
 
 
+# First characters of anything json.loads accepts (including NaN/Infinity)
+_JSON_START_CHARS = frozenset('{["-0123456789tfnNI')
+
+
 def parse_value(value_str: str) -> Any:
     """Parse a value string, attempting JSON if possible.
 
@@ -264,6 +336,11 @@ def parse_value(value_str: str) -> Any:
     Returns:
         Parsed value (JSON object/array/bool/number) or original string
     """
+    # Paths and plain words can't be JSON; skip the raise-and-catch for them
+    stripped = value_str.lstrip()
+    if not stripped or stripped[0] not in _JSON_START_CHARS:
+        return value_str
+
     # Try to parse as JSON
     try:
         return json.loads(value_str)
@@ -296,19 +373,53 @@ def deep_merge(base: dict, override: dict) -> dict:
 # =============================================================================
 
 
+@lru_cache(maxsize=8)
+def _parse_config_file(config_path: Path, mtime_ns: int, size: int) -> dict:
+    """Parse a config file once per (path, mtime, size), so edits are picked up."""
+    try:
+        # json detects the UTF encoding itself, so skip the locale-dependent text decode
+        return json.loads(config_path.read_bytes())
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+        return {}
+
+
+def _config_file_key(config_path: Path) -> Optional[tuple[Path, int, int]]:
+    """Return the (path, mtime, size) cache key for a config file, or None if it's missing."""
+    try:
+        stat = config_path.stat()
+    except OSError:
+        return None
+    return (config_path, stat.st_mtime_ns, stat.st_size)
+
+
+def _read_config_file(config_path: Path) -> dict:
+    """Load a JSON config file, or empty dict if it doesn't exist.
+
+    Returns a copy, so callers are free to mutate the result.
+    """
+    key = _config_file_key(config_path)
+    if key is None:
+        return {}
+    return copy.deepcopy(_parse_config_file(*key))
+
+
+@lru_cache(maxsize=4)
+def _merge_config_files(
+    user_key: Optional[tuple[Path, int, int]], project_key: Optional[tuple[Path, int, int]]
+) -> dict:
+    """Merge the user and project config files once per pair of file versions."""
+    user_config = _parse_config_file(*user_key) if user_key else {}
+    project_config = _parse_config_file(*project_key) if project_key else {}
+    return deep_merge(user_config, project_config)
+
+
 def load_user_config() -> dict:
     """Load user config from ~/.config/rhdh/config.json.
 
     Returns:
         Config dict, or empty dict if file doesn't exist.
     """
-    config_path = get_user_config_path()
-    if not config_path.exists():
-        return {}
-    try:
-        return json.loads(config_path.read_text())
-    except (json.JSONDecodeError, OSError):
-        return {}
+    return _read_config_file(get_user_config_path())
 
 
 def load_project_config() -> dict:
@@ -317,24 +428,53 @@ def load_project_config() -> dict:
     Returns:
         Config dict, or empty dict if file doesn't exist.
     """
-    config_path = get_project_config_path()
-    if not config_path.exists():
-        return {}
-    try:
-        return json.loads(config_path.read_text())
-    except (json.JSONDecodeError, OSError):
-        return {}
+    return _read_config_file(get_project_config_path())
 
 
 def load_merged_config() -> dict:
     """Load merged config (user + project, project takes precedence).
 
+    The merge is reused until either file changes on disk.
+
     Returns:
-        Merged config dict.
+        Merged config dict (a copy, safe to mutate).
     """
-    user_config = load_user_config()
-    project_config = load_project_config()
-    return deep_merge(user_config, project_config)
+    merged = _merge_config_files(
+        _config_file_key(get_user_config_path()), _config_file_key(get_project_config_path())
+    )
+    return copy.deepcopy(merged)
+
+
+def write_file_atomic(path: Path, data: str | bytes) -> None:
+    """Write a file via a temp file and rename, so readers never see a partial write.
+
+    Symlinks are followed, so the link target is updated rather than replaced,
+    and an existing file keeps its permissions.
+    """
+    # Writes are rare next to reads; keep tempfile off the common import path
+    import tempfile
+
+    target = path.resolve()
+    try:
+        mode = target.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        # New file: mkstemp's 0600 would be stricter than a plain open()
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data.encode() if isinstance(data, str) else data)
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
 
 
 def save_config(config: dict, global_: bool = False) -> bool:
@@ -356,10 +496,22 @@ def save_config(config: dict, global_: bool = False) -> bool:
 
     try:
         config_dir.mkdir(parents=True, exist_ok=True)
-        config_path.write_text(json.dumps(config, indent=2) + "\n")
+        write_file_atomic(config_path, json.dumps(config, indent=2) + "\n")
         return True
     except OSError:
         return False
+    finally:
+        config_invalidate_cache()
+
+
+def config_invalidate_cache() -> None:
+    """Drop cached git roots, repo paths, config info and the detected GitHub user."""
+    _git_root_for.cache_clear()
+    _repo_cache.clear()
+    _parse_config_file.cache_clear()
+    _merge_config_files.cache_clear()
+    get_config_info.cache_clear()
+    _detect_github_username.cache_clear()
 
 
 # =============================================================================
@@ -380,12 +532,20 @@ def _config_key_to_env_var(config_key: str) -> str:
     return f"RHDH_{config_key.upper().replace('-', '_')}_REPO"
 
 
-def find_repo(repo_name: str, env_var: str) -> Optional[Path]:
+def find_repo(
+    repo_name: str,
+    env_var: str,
+    *,
+    config: Optional[dict] = None,
+    skill_root: Optional[Path] = None,
+) -> Optional[Path]:
     """Find a repository in well-known locations.
 
     Args:
         repo_name: Directory name to look for (e.g., "rhdh-plugin-export-overlays")
         env_var: Environment variable that can override (e.g., "RHDH_OVERLAY_REPO")
+        config: Already-loaded merged config, to share one read across repos
+        skill_root: Already-resolved skill root
 
     Returns:
         Path to the repository, or None if not found.
@@ -396,33 +556,27 @@ def find_repo(repo_name: str, env_var: str) -> Optional[Path]:
     3. Skill install root (../repo/ relative to skill)
     4. Parent's repo/ directory (if skill is deeper nested)
     """
+    # Candidates are plain strings; only the one that exists becomes a Path
     # 1. Environment variable override
     env_value = os.environ.get(env_var)
-    if env_value:
-        path = Path(env_value)
-        if path.is_dir():
-            return path.resolve()
+    if env_value and os.path.isdir(env_value):
+        return Path(os.path.realpath(env_value))
 
     # 2. Merged config (project overrides user)
-    config = load_merged_config()
-    # Map repo directory names to config keys
+    if config is None:
+        config = load_merged_config()
     config_key = _repo_name_to_config_key(repo_name)
     config_path = config.get("repos", {}).get(config_key)
-    if config_path:
-        path = Path(config_path)
-        if path.is_dir():
-            return path.resolve()
+    if config_path and os.path.isdir(config_path):
+        return Path(os.path.realpath(config_path))
 
     # 3. Skill install root (../repo/ relative to skill)
-    skill_root = get_skill_root()
-    skill_repo_path = skill_root.parent / "repo" / repo_name
-    if skill_repo_path.is_dir():
-        return skill_repo_path.resolve()
-
     # 4. Parent's repo/ directory (if skill is deeper nested)
-    parent_repo_path = skill_root.parent.parent / "repo" / repo_name
-    if parent_repo_path.is_dir():
-        return parent_repo_path.resolve()
+    skill_parent = os.path.dirname(os.fspath(skill_root or get_skill_root()))
+    for base in (skill_parent, os.path.dirname(skill_parent)):
+        candidate = os.path.join(base, "repo", repo_name)
+        if os.path.isdir(candidate):
+            return Path(os.path.realpath(candidate))
 
     return None
 
@@ -436,12 +590,43 @@ def get_repo(config_key: str) -> Optional[Path]:
     Returns:
         Path to the repository, or None if not found.
     """
-    # Find the repo name from the config key
+    return resolve_all_repos().get(config_key)
+
+
+def resolve_all_repos(config: Optional[dict] = None) -> dict[str, Optional[Path]]:
+    """Resolve paths for all submodule repos, keyed by config key.
+
+    Repos missing from the cache are discovered together so the merged config
+    (and the git root lookup behind it) is read once rather than once per repo.
+    Callers that already hold the merged config can pass it in.
+    """
+    cache_keys = {}
+    missing = []
     for repo_name, info in SUBMODULE_REPOS.items():
-        if info["config_key"] == config_key:
-            env_var = _config_key_to_env_var(config_key)
-            return find_repo(repo_name, env_var)
-    return None
+        config_key = info["config_key"]
+        env_var = _config_key_to_env_var(config_key)
+        cache_key = (config_key, os.environ.get(env_var))
+        cache_keys[config_key] = cache_key
+        if cache_key not in _repo_cache:
+            missing.append((repo_name, env_var, cache_key))
+
+    if missing:
+        if config is None:
+            config = load_merged_config()
+        skill_root = get_skill_root()
+        for repo_name, env_var, cache_key in missing:
+            _repo_cache[cache_key] = find_repo(
+                repo_name, env_var, config=config, skill_root=skill_root
+            )
+
+    return {config_key: _repo_cache[cache_key] for config_key, cache_key in cache_keys.items()}
+
+
+def repo_discovery_env() -> dict[str, Optional[str]]:
+    """Current values of the environment variables that steer repo discovery."""
+    names = [_config_key_to_env_var(info["config_key"]) for info in SUBMODULE_REPOS.values()]
+    names += ["RHDH_LOCAL_SETUP_DIR", "SKILL_ROOT"]
+    return {name: os.environ.get(name) for name in names}
 
 
 def get_overlay_repo() -> Optional[Path]:
@@ -459,10 +644,11 @@ def get_factory_repo() -> Optional[Path]:
     return get_repo("factory")
 
 
-def find_local_setup_dir() -> Optional[Path]:
+def find_local_setup_dir(config: Optional[dict] = None) -> Optional[Path]:
     """Find the rhdh-local-setup workspace directory.
 
     rhdh-local-setup is a personal workspace wrapper (not a GitHub repo/submodule).
+    Callers that already hold the merged config can pass it in.
 
     Discovery order:
     1. RHDH_LOCAL_SETUP_DIR environment variable
@@ -478,7 +664,8 @@ def find_local_setup_dir() -> Optional[Path]:
             return path.resolve()
 
     # 2. Merged config
-    config = load_merged_config()
+    if config is None:
+        config = load_merged_config()
     config_path = config.get("repos", {}).get("local_setup")
     if config_path:
         path = Path(config_path)
@@ -505,9 +692,17 @@ def find_local_setup_dir() -> Optional[Path]:
     return None
 
 
-def get_local_setup_dir() -> Optional[Path]:
+def get_local_setup_dir(config: Optional[dict] = None) -> Optional[Path]:
     """Get path to rhdh-local-setup workspace directory."""
-    return find_local_setup_dir()
+    # Discovery can fall back to the rhdh-local repo, so its override is part of the key
+    cache_key = (
+        "local_setup",
+        os.environ.get("RHDH_LOCAL_SETUP_DIR"),
+        os.environ.get("RHDH_LOCAL_REPO"),
+    )
+    if cache_key not in _repo_cache:
+        _repo_cache[cache_key] = find_local_setup_dir(config)
+    return _repo_cache[cache_key]
 
 
 # =============================================================================
@@ -585,9 +780,11 @@ def _config_init(force: bool, global_: bool) -> tuple[bool, dict | str, list[str
 
     try:
         config_dir.mkdir(parents=True, exist_ok=True)
-        config_path.write_text(json.dumps(config, indent=2) + "\n")
+        write_file_atomic(config_path, json.dumps(config, indent=2) + "\n")
     except OSError as e:
         return False, f"Failed to write config: {e}", []
+    finally:
+        config_invalidate_cache()
 
     data = {
         "created": str(config_path),
@@ -599,14 +796,9 @@ def _config_init(force: bool, global_: bool) -> tuple[bool, dict | str, list[str
     return True, data, next_steps
 
 
-def _resolve_all_repos() -> dict[str, str | None]:
+def _resolve_all_repos(config: Optional[dict] = None) -> dict[str, str | None]:
     """Resolve paths for all configured repos."""
-    resolved = {}
-    for info in SUBMODULE_REPOS.values():
-        key = info["config_key"]
-        path = get_repo(key)
-        resolved[key] = str(path) if path else None
-    return resolved
+    return {key: str(path) if path else None for key, path in resolve_all_repos(config).items()}
 
 
 def _config_show(global_: bool) -> tuple[bool, dict, list[str]]:
@@ -614,6 +806,10 @@ def _config_show(global_: bool) -> tuple[bool, dict, list[str]]:
     user_config = load_user_config()
     project_config = load_project_config()
     merged_config = deep_merge(user_config, project_config)
+    # Repo discovery reuses the configs loaded here instead of reading them again.
+    # Resolve the repos first: local setup discovery falls back to the rhdh-local repo
+    resolved = _resolve_all_repos(merged_config)
+    local_setup = get_local_setup_dir(merged_config)
 
     data = {
         "user_config_path": str(get_user_config_path()),
@@ -622,8 +818,8 @@ def _config_show(global_: bool) -> tuple[bool, dict, list[str]]:
         "project_config": project_config if project_config else None,
         "merged_config": merged_config if merged_config else None,
         "resolved": {
-            **_resolve_all_repos(),
-            "local_setup": str(get_local_setup_dir()) if get_local_setup_dir() else None,
+            **resolved,
+            "local_setup": str(local_setup) if local_setup else None,
         },
     }
 
@@ -686,9 +882,7 @@ def _config_set(
         return False, "Value is required for 'config set'", []
 
     # Map shorthand keys to full dot-notation paths
-    all_config_keys = {info["config_key"] for info in SUBMODULE_REPOS.values()}
-    all_config_keys.add("local_setup")
-    if key in all_config_keys:
+    if key in REPO_CONFIG_KEYS:
         key = f"repos.{key}"
 
     # Load appropriate config
@@ -727,6 +921,9 @@ def _config_set(
 def get_github_username() -> str | None:
     """Get the authenticated GitHub username via gh CLI.
 
+    A username detected via gh is saved to the user config, so later runs
+    skip the GitHub API round-trip.
+
     Returns:
         GitHub username, or None if not authenticated or gh not available.
     """
@@ -736,7 +933,22 @@ def get_github_username() -> str | None:
     if cached_username:
         return cached_username
 
-    # Detect via gh CLI
+    username = _detect_github_username()
+    if username:
+        save_github_username(username, global_=True)
+    return username
+
+
+@lru_cache(maxsize=1)
+def _detect_github_username() -> str | None:
+    """Ask gh for the authenticated login, at most once per process.
+
+    Submodule list and add look the user up several times per run, and each
+    probe is a GitHub API round-trip.
+    """
+    # Most commands never shell out, so subprocess is imported where it's used
+    import subprocess
+
     try:
         result = subprocess.run(
             ["gh", "api", "user", "--jq", ".login"],
@@ -822,26 +1034,42 @@ def get_repo_urls(repo_name: str, github_username: str | None = None) -> tuple[s
 # =============================================================================
 
 
-def is_submodule(repo_path: Path) -> bool:
-    """Check if a path is already configured as a git submodule."""
-    git_root = find_git_root()
-    if not git_root:
-        return False
+def _gitmodules_paths(git_root: Path) -> frozenset[str]:
+    """Submodule paths listed in the project's .gitmodules (empty if it has none)."""
+    # Like get_remote_url, only submodule commands get here
+    import configparser
+
+    parser = configparser.ConfigParser(strict=False, interpolation=None)
+    try:
+        parser.read(git_root / ".gitmodules")
+    except configparser.Error:
+        return frozenset()
+    return frozenset(
+        parser.get(section, "path")
+        for section in parser.sections()
+        if parser.has_option(section, "path")
+    )
+
 
-    gitmodules = git_root / ".gitmodules"
-    if not gitmodules.exists():
+def is_submodule(repo_path: Path, git_root: Path | None = None) -> bool:
+    """Check if a path is already configured as a git submodule.
+
+    Callers that already know the project root can pass `git_root`.
+    """
+    if git_root is None:
+        git_root = find_git_root()
+    if not git_root:
         return False
 
-    # Check if path is in .gitmodules
-    rel_path = str(repo_path.relative_to(git_root))
-    content = gitmodules.read_text()
-    return rel_path in content
+    # Compare whole paths, so repo/rhdh doesn't match repo/rhdh-cli
+    return str(repo_path.relative_to(git_root)) in _gitmodules_paths(git_root)
 
 
 def setup_submodule(
     name: str,
     dry_run: bool = False,
     github_username: str | None = None,
+    git_root: Path | None = None,
 ) -> tuple[bool, dict | str, list[str]]:
     """Set up a repository as a git submodule.
 
@@ -849,6 +1077,7 @@ def setup_submodule(
         name: Repository name (key in SUBMODULE_REPOS)
         dry_run: If True, only show what would be done
         github_username: GitHub username for fork URLs (auto-detected if None)
+        git_root: Project git root (found from the working directory if None)
 
     Returns:
         Tuple of (success: bool, data: dict|str, next_steps: list[str])
@@ -870,7 +1099,8 @@ def setup_submodule(
             ["gh auth login", "rhdh config set github.username <your-username>"],
         )
 
-    git_root = find_git_root()
+    if git_root is None:
+        git_root = find_git_root()
     if not git_root:
         return (
             False,
@@ -892,7 +1122,7 @@ def setup_submodule(
     repo_dir.mkdir(parents=True, exist_ok=True)
 
     # Check if already a submodule
-    if is_submodule(submodule_path):
+    if is_submodule(submodule_path, git_root):
         # Verify/update remotes
         if submodule_path.exists():
             _ensure_upstream(submodule_path, upstream_url)
@@ -929,6 +1159,8 @@ def setup_submodule(
         )
 
     # Add as submodule
+    import subprocess
+
     try:
         result = subprocess.run(
             ["git", "submodule", "add", origin_url, f"{SUBMODULE_DIR}/{name}"],
@@ -969,14 +1201,9 @@ def _ensure_upstream(repo_path: Path, upstream_url: str | None) -> None:
         return
 
     # Check if upstream already exists
-    result = subprocess.run(
-        ["git", "remote", "get-url", "upstream"],
-        capture_output=True,
-        text=True,
-        cwd=repo_path,
-    )
+    if get_remote_url(repo_path, "upstream") is None:
+        import subprocess
 
-    if result.returncode != 0:
         # Add upstream
         subprocess.run(
             ["git", "remote", "add", "upstream", upstream_url],
@@ -1011,22 +1238,34 @@ def list_submodule_repos() -> list[dict]:
     github_username = get_github_username()
     result = []
 
+    # Resolve configured repos, read .gitmodules and the submodule directory
+    # once up front, not once per repo
+    configured = resolve_all_repos()
+    gitmodules: frozenset[str] = frozenset()
+    present: set[str] = set()
+    if git_root:
+        gitmodules = _gitmodules_paths(git_root)
+        try:
+            present = set(os.listdir(git_root / SUBMODULE_DIR))
+        except OSError:
+            pass
+
     for name, info in SUBMODULE_REPOS.items():
         status = "not_configured"
         path = None
 
         if git_root:
             submodule_path = git_root / SUBMODULE_DIR / name
-            if is_submodule(submodule_path):
+            if str(Path(SUBMODULE_DIR, name)) in gitmodules:
                 status = "submodule"
                 path = str(submodule_path)
-            elif submodule_path.exists():
+            elif name in present:
                 status = "directory_exists"
                 path = str(submodule_path)
 
         # Also check if configured via other means
         config_key = info["config_key"]
-        discovered = get_repo(config_key)
+        discovered = configured.get(config_key)
         if discovered:
             status = "configured" if status == "not_configured" else status
             path = str(discovered) if not path else path
@@ -1129,6 +1368,7 @@ def config_set(key: str, value: str) -> tuple[bool, str]:
         return False, str(data)
 
 
+@lru_cache(maxsize=1)
 def get_config_info() -> dict:
     """Get configuration info for display.
 
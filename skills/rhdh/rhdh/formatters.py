@@ -15,7 +15,7 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
 
 
 def detect_output_mode() -> str:
@@ -95,7 +95,9 @@ class OutputFormatter:
             response["next_steps"] = next_steps
         if self.verbose and self._debug_info:
             response["debug"] = self._debug_info
-        print(json.dumps(response, indent=2, default=str))
+        # Stream straight to stdout rather than building the whole string first
+        json.dump(response, sys.stdout, indent=2, default=str)
+        sys.stdout.write("\n")
 
     def _render_human_success(
         self,
@@ -145,6 +147,7 @@ class OutputFormatter:
 
     def _render_checks(self, checks: list[dict], prefix: str) -> None:
         """Render a list of check results."""
+        lines = []
         for check in checks:
             status = check.get("status", "unknown")
             name = check.get("name", "unknown")
@@ -158,9 +161,10 @@ class OutputFormatter:
                 icon = f"{RED}✗{NC}"
 
             if message:
-                print(f"{prefix}{icon} {name}: {message}")
+                lines.append(f"{prefix}{icon} {name}: {message}\n")
             else:
-                print(f"{prefix}{icon} {name}")
+                lines.append(f"{prefix}{icon} {name}\n")
+        sys.stdout.writelines(lines)
 
     def _render_items(self, items: list[dict], prefix: str) -> None:
         """Render a list of items (workspaces, etc.)."""
@@ -203,7 +207,8 @@ class OutputFormatter:
             response["next_steps"] = next_steps
         if self.verbose and self._debug_info:
             response["debug"] = self._debug_info
-        print(json.dumps(response, indent=2))
+        json.dump(response, sys.stdout, indent=2)
+        sys.stdout.write("\n")
 
     def _render_human_error(
         self,
@@ -275,8 +280,30 @@ class OutputFormatter:
             return
 
         print()
-        for item in items:
-            print(f"  {format_fn(item)}")
+        # One write for the whole list instead of a print() per row
+        sys.stdout.write("".join(f"  {format_fn(item)}\n" for item in items))
+        if summary:
+            print()
+            print(f"  {summary}")
+        self._has_human_output = True
+
+    def render_lines(
+        self,
+        lines: Iterable[str],
+        *,
+        summary: str | None = None,
+    ) -> None:
+        """Render pre-formatted, newline-terminated lines (human mode only).
+
+        Args:
+            lines: Lines to write as-is, e.g. from a batch formatter
+            summary: Optional summary line (e.g., "Total: 5 items")
+        """
+        if not self.is_human:
+            return
+
+        print()
+        sys.stdout.writelines(lines)
         if summary:
             print()
             print(f"  {summary}")
@@ -8,11 +8,11 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from .config import get_data_dir
+from .config import get_data_dir, write_file_atomic
 
 TODO_FILENAME = "TODO.md"
 
@@ -26,8 +26,32 @@ def get_todo_file() -> Path:
     return get_data_dir() / TODO_FILENAME
 
 
-# Pattern for H2 todo headers: ## [ ] Title or ## [x] Title
-TODO_HEADER_PATTERN = re.compile(r"^## \[([ x])\] (.+)$")
+# TODO.md is scanned as raw bytes (all markup is ASCII); only the pieces that
+# end up in a TodoItem are decoded.
+
+# Lines that matter when parsing: comment markers, H2 todo headers
+# (## [ ] Title or ## [x] Title, captured as done/title) and `---` separators
+TODO_LINE_PATTERN = re.compile(
+    rb"^[^\n]*(?:<!--|-->)[^\n]*$"
+    rb"|^## \[(?P<done>[ x])\] (?P<title>[^\n]+)$"
+    rb"|^[^\S\n]*---[^\S\n]*$",
+    re.MULTILINE,
+)
+
+# Metadata fields within a todo section
+METADATA_PATTERN = re.compile(rb"^\*\*(Created|Completed|Context):\*\*([^\n]*)$", re.MULTILINE)
+
+# Section separator line and the first non-heading text line, for add_todo
+SEPARATOR_LINE_PATTERN = re.compile(rb"^[^\S\n]*---[^\S\n]*$", re.MULTILINE)
+FIRST_TEXT_LINE_PATTERN = re.compile(rb"^(?!#)(?=[^\n]*\S)", re.MULTILINE)
+
+# Lines edited by mark_done and add_note
+DONE_HEADER_PREFIX = b"## [x]"
+CREATED_LINE_PATTERN = re.compile(rb"^\*\*Created:\*\*.*$", re.MULTILINE)
+NOTES_HEADING_PATTERN = re.compile(rb"^[^\S\n]*### Notes[^\S\n]*$", re.MULTILINE)
+
+# Runs of characters that are not allowed in a slug
+SLUG_INVALID_PATTERN = re.compile(r"[^a-z0-9]+")
 
 # Default template content
 DEFAULT_TODO_CONTENT = """\
@@ -59,8 +83,8 @@ class TodoItem:
     slug: str
     title: str
     done: bool
-    line_start: int  # Line number where H2 starts (0-indexed)
-    line_end: int  # Line number where section ends (exclusive)
+    offset_start: int  # Byte offset in TODO.md where the H2 starts
+    offset_end: int  # Byte offset where the section ends (exclusive)
     created: Optional[str] = None
     completed: Optional[str] = None
     context: Optional[str] = None
@@ -72,7 +96,7 @@ def slugify(title: str) -> str:
     # Lowercase
     slug = title.lower()
     # Replace non-alphanumeric with hyphens
-    slug = re.sub(r"[^a-z0-9]+", "-", slug)
+    slug = SLUG_INVALID_PATTERN.sub("-", slug)
     # Remove leading/trailing hyphens
     slug = slug.strip("-")
     # Limit length
@@ -81,96 +105,112 @@ def slugify(title: str) -> str:
     return slug
 
 
+@lru_cache(maxsize=1)
+def _utc_today() -> str:
+    """Today's UTC date as YYYY-MM-DD, computed once per invocation.
+
+    datetime is imported here so read-only commands like `todo list` skip it.
+    """
+    from datetime import datetime, timezone
+
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+
+# Last TODO.md content read or written by this process: path -> (mtime_ns, size, content)
+_todo_cache: dict[Path, tuple[int, int, bytes]] = {}
+
+
+def _read_todo_content() -> bytes:
+    """Read TODO.md, reusing this process's last read or write while the file is unchanged."""
+    todo_file = _ensure_todo_file()
+    stat = todo_file.stat()
+    cached = _todo_cache.get(todo_file)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    content = todo_file.read_bytes()
+    _todo_cache.clear()
+    _todo_cache[todo_file] = (stat.st_mtime_ns, stat.st_size, content)
+    return content
+
+
+def _write_todo_content(todo_file: Path, content: bytes) -> None:
+    """Atomically replace TODO.md and remember what was written."""
+    write_file_atomic(todo_file, content)
+    stat = todo_file.stat()
+    _todo_cache.clear()
+    _todo_cache[todo_file] = (stat.st_mtime_ns, stat.st_size, content)
+
+
 def _ensure_todo_file() -> Path:
     """Ensure todo file exists with template, return path."""
     todo_file = get_todo_file()
-    todo_file.parent.mkdir(parents=True, exist_ok=True)
+    # Only touch the directory on first use; the file check is all most calls need
     if not todo_file.exists():
-        todo_file.write_text(DEFAULT_TODO_CONTENT)
+        todo_file.parent.mkdir(parents=True, exist_ok=True)
+        _write_todo_content(todo_file, DEFAULT_TODO_CONTENT.encode())
     return todo_file
 
 
-def _parse_todos(content: str) -> list[TodoItem]:
-    """Parse todo items from markdown content.
+def _parse_todos(content: bytes, include_done: bool = True) -> list[TodoItem]:
+    """Parse todo items from raw markdown content.
 
     Each todo section ends at the next `---` separator or next H2 header.
-    Skips content inside HTML comments (template section).
+    Skips content inside HTML comments (template section), and completed
+    sections unless include_done is set.
     """
-    lines = content.split("\n")
     todos = []
-    current_todo: Optional[dict] = None
+    current: Optional[tuple[str, bool, int]] = None  # (title, done, offset_start)
     in_comment = False
 
-    for i, line in enumerate(lines):
+    # Only comment markers, separators and headers affect parsing, so visit just those lines
+    for match in TODO_LINE_PATTERN.finditer(content):
+        line = match.group(0)
         # Track HTML comment blocks (skip template)
-        if "<!--" in line:
-            in_comment = True
-        if "-->" in line:
+        if b"-->" in line:
             in_comment = False
             continue
+        if b"<!--" in line:
+            in_comment = True
         if in_comment:
             continue
 
-        # Section separator ends current todo
-        if line.strip() == "---" and current_todo is not None:
-            current_todo["line_end"] = i
-            todos.append(_make_todo_item(current_todo, lines))
-            current_todo = None
-            continue
-
-        match = TODO_HEADER_PATTERN.match(line)
-        if match:
-            # Save previous todo (shouldn't happen if --- is used, but handle it)
-            if current_todo is not None:
-                current_todo["line_end"] = i
-                todos.append(_make_todo_item(current_todo, lines))
-
-            # Start new todo
-            done = match.group(1) == "x"
-            title = match.group(2).strip()
-            current_todo = {
-                "title": title,
-                "done": done,
-                "line_start": i,
-                "line_end": len(lines),  # Will be updated
-            }
+        # The header groups are only set when the header alternative matched
+        done = match.group("done")
+        if current is not None:
+            # A separator ends the current todo; a header without one does too
+            todos.append(_make_todo_item(content, *current, match.start()))
+            current = None
+        if done == b" " or (done == b"x" and include_done):
+            current = (match.group("title").decode().strip(), done == b"x", match.start())
 
     # Save last todo if no trailing ---
-    if current_todo is not None:
-        current_todo["line_end"] = len(lines)
-        todos.append(_make_todo_item(current_todo, lines))
+    if current is not None:
+        todos.append(_make_todo_item(content, *current, len(content)))
 
     return todos
 
 
-def _make_todo_item(data: dict, lines: list[str]) -> TodoItem:
-    """Create TodoItem from parsed data."""
-    section_lines = lines[data["line_start"] : data["line_end"]]
-    raw_content = "\n".join(section_lines)
+def _make_todo_item(content: bytes, title: str, done: bool, start: int, end: int) -> TodoItem:
+    """Create TodoItem from the section of content between two offsets."""
+    # A section ended by a later line doesn't include the newline before that line
+    section = content[start : end if end == len(content) else end - 1]
 
-    # Extract metadata from section
-    created = None
-    completed = None
-    context = None
-
-    for line in section_lines:
-        if line.startswith("**Created:**"):
-            created = line.replace("**Created:**", "").strip()
-        elif line.startswith("**Completed:**"):
-            completed = line.replace("**Completed:**", "").strip()
-        elif line.startswith("**Context:**"):
-            context = line.replace("**Context:**", "").strip()
+    # Extract metadata from section (the last occurrence of each field wins)
+    metadata = {
+        field.decode().lower(): value.decode().strip()
+        for field, value in METADATA_PATTERN.findall(section)
+    }
 
     return TodoItem(
-        slug=slugify(data["title"]),
-        title=data["title"],
-        done=data["done"],
-        line_start=data["line_start"],
-        line_end=data["line_end"],
-        created=created,
-        completed=completed,
-        context=context,
-        raw_content=raw_content,
+        slug=slugify(title),
+        title=title,
+        done=done,
+        offset_start=start,
+        offset_end=end,
+        created=metadata.get("created"),
+        completed=metadata.get("completed"),
+        context=metadata.get("context"),
+        raw_content=section.decode(),
     )
 
 
@@ -183,14 +223,7 @@ def list_todos(include_done: bool = True) -> list[TodoItem]:
     Returns:
         List of TodoItem objects
     """
-    todo_file = _ensure_todo_file()
-    content = todo_file.read_text()
-    todos = _parse_todos(content)
-
-    if not include_done:
-        todos = [t for t in todos if not t.done]
-
-    return todos
+    return _parse_todos(_read_todo_content(), include_done=include_done)
 
 
 def get_todo(slug: str) -> Optional[TodoItem]:
@@ -202,7 +235,12 @@ def get_todo(slug: str) -> Optional[TodoItem]:
     Returns:
         TodoItem if found, None otherwise
     """
-    todos = list_todos()
+    return _get_todo_from_content(slug, _read_todo_content())
+
+
+def _get_todo_from_content(slug: str, content: bytes) -> Optional[TodoItem]:
+    """Find a todo by slug (or partial match) in already-read TODO.md content."""
+    todos = _parse_todos(content)
 
     # Exact match first
     for todo in todos:
@@ -227,11 +265,10 @@ def add_todo(title: str, context: Optional[str] = None) -> TodoItem:
     Returns:
         The created TodoItem
     """
-    todo_file = _ensure_todo_file()
-    content = todo_file.read_text()
-    lines = content.split("\n")
+    todo_file = get_todo_file()
+    content = _read_todo_content()
 
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    today = _utc_today()
 
     # Build new section
     new_section = [
@@ -251,34 +288,32 @@ def add_todo(title: str, context: Optional[str] = None) -> TodoItem:
             "",
         ]
     )
+    section_text = "\n".join(new_section).encode()
+
+    # Find insertion point: after the first "---" separator (end of header),
+    # else before the first non-heading line, else at the end of the file
+    separator = SEPARATOR_LINE_PATTERN.search(content)
+    if separator:
+        insert_at = separator.end() + 1
+    else:
+        first_text = FIRST_TEXT_LINE_PATTERN.search(content)
+        insert_at = first_text.start() if first_text else None
 
-    # Find insertion point (after header, before first todo or template)
-    insert_at = None
-    for i, line in enumerate(lines):
-        # After the first "---" separator (end of header)
-        if line.strip() == "---" and insert_at is None:
-            insert_at = i + 1
-            break
-
-    if insert_at is None:
-        # Fallback: insert after first non-empty line
-        for i, line in enumerate(lines):
-            if line.strip() and not line.startswith("#"):
-                insert_at = i
-                break
-        if insert_at is None:
-            insert_at = len(lines)
-
-    # Insert new section
-    new_lines = lines[:insert_at] + [""] + new_section + lines[insert_at:]
-    todo_file.write_text("\n".join(new_lines))
+    # Splice the new section in preceded by a blank line
+    if insert_at is None or insert_at > len(content):
+        insert_at = len(content) + 1
+        _write_todo_content(todo_file, content + b"\n\n" + section_text)
+    else:
+        _write_todo_content(
+            todo_file, content[:insert_at] + b"\n" + section_text + b"\n" + content[insert_at:]
+        )
 
     return TodoItem(
         slug=slugify(title),
         title=title,
         done=False,
-        line_start=insert_at + 1,
-        line_end=insert_at + 1 + len(new_section),
+        offset_start=insert_at + 1,
+        offset_end=insert_at + 1 + len(section_text),
         created=today,
         context=context,
     )
@@ -293,31 +328,32 @@ def mark_done(slug: str) -> Optional[TodoItem]:
     Returns:
         Updated TodoItem if found, None otherwise
     """
-    todo = get_todo(slug)
+    todo_file = get_todo_file()
+    content = _read_todo_content()
+
+    todo = _get_todo_from_content(slug, content)
     if not todo:
         return None
 
     if todo.done:
         return todo  # Already done
 
-    todo_file = get_todo_file()
-    content = todo_file.read_text()
-    lines = content.split("\n")
-
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    today = _utc_today()
 
-    # Update the header line
-    header_line = lines[todo.line_start]
-    lines[todo.line_start] = header_line.replace("## [ ]", "## [x]")
+    # The section starts with its "## [ ]" header, so overwrite that fixed-width prefix
+    section = (
+        DONE_HEADER_PREFIX + content[todo.offset_start + len(DONE_HEADER_PREFIX) : todo.offset_end]
+    )
 
     # Add completed date after Created line
-    for i in range(todo.line_start, min(todo.line_end, len(lines))):
-        if lines[i].startswith("**Created:**"):
-            # Insert completed line after created
-            lines.insert(i + 1, f"**Completed:** {today}")
-            break
+    created = CREATED_LINE_PATTERN.search(section)
+    if created:
+        completed_line = f"\n**Completed:** {today}".encode()
+        section = section[: created.end()] + completed_line + section[created.end() :]
 
-    todo_file.write_text("\n".join(lines))
+    _write_todo_content(
+        todo_file, content[: todo.offset_start] + section + content[todo.offset_end :]
+    )
 
     todo.done = True
     todo.completed = today
@@ -334,47 +370,43 @@ def add_note(slug: str, note: str) -> Optional[TodoItem]:
     Returns:
         Updated TodoItem if found, None otherwise
     """
-    todo = get_todo(slug)
+    todo_file = get_todo_file()
+    content = _read_todo_content()
+
+    todo = _get_todo_from_content(slug, content)
     if not todo:
         return None
 
-    todo_file = get_todo_file()
-    content = todo_file.read_text()
-    lines = content.split("\n")
-
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    note_line = f"- {today}: {note}"
-
-    # Find "### Notes" section within the todo
-    notes_line = None
-    for i in range(todo.line_start, min(todo.line_end, len(lines))):
-        if lines[i].strip() == "### Notes":
-            notes_line = i
-            break
-
-    if notes_line is not None:
-        # Insert note after "### Notes"
-        lines.insert(notes_line + 1, note_line)
+    today = _utc_today()
+    note_line = f"- {today}: {note}\n".encode()
+
+    # Find "### Notes" section within the todo and insert the note after it
+    section = content[todo.offset_start : todo.offset_end]
+    notes = NOTES_HEADING_PATTERN.search(section)
+    if notes:
+        insert_at = todo.offset_start + notes.end()
+        if content[insert_at : insert_at + 1] == b"\n":
+            insert_at += 1
+            new_text = note_line
+        else:
+            # Heading is the last line and has no newline of its own
+            new_text = b"\n" + note_line
     else:
-        # Create Notes section before section end
-        # Find the "---" separator
-        for i in range(todo.line_start, min(todo.line_end, len(lines))):
-            if lines[i].strip() == "---":
-                lines.insert(i, "")
-                lines.insert(i, note_line)
-                lines.insert(i, "### Notes")
-                break
+        # Create Notes section at the end of the todo's section
+        insert_at = todo.offset_end
+        prefix = b"" if section.endswith(b"\n") else b"\n"
+        new_text = prefix + b"### Notes\n" + note_line + b"\n"
 
-    todo_file.write_text("\n".join(lines))
+    content = content[:insert_at] + new_text + content[insert_at:]
+    _write_todo_content(todo_file, content)
 
-    # Re-fetch to get updated content
-    return get_todo(slug)
+    # Re-parse the written content to get the updated item
+    return _get_todo_from_content(slug, content)
 
 
 def show_raw() -> str:
     """Return the raw TODO.md content."""
-    todo_file = _ensure_todo_file()
-    return todo_file.read_text()
+    return _read_todo_content().decode()
 
 
 def get_todo_file_path() -> Path:
@@ -7,15 +7,22 @@ Stored in ~/.config/rhdh/worklog.jsonl (or RHDH_DATA_DIR if set).
 from __future__ import annotations
 
 import json
-import re
+import os
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, BinaryIO, Optional
 
 from .config import get_data_dir
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
 WORKLOG_FILENAME = "worklog.jsonl"
 
+# Lengths of UTC isoformat() timestamps without and with microseconds
+UTC_ISO_LENGTHS = (25, 32)
+
 
 def get_worklog_file() -> Path:
     """Get the worklog file path.
@@ -29,8 +36,9 @@ def get_worklog_file() -> Path:
 def _ensure_worklog() -> Path:
     """Ensure worklog file exists, return path."""
     worklog_file = get_worklog_file()
-    worklog_file.parent.mkdir(parents=True, exist_ok=True)
+    # The directory can only be missing if the file is
     if not worklog_file.exists():
+        worklog_file.parent.mkdir(parents=True, exist_ok=True)
         worklog_file.touch()
     return worklog_file
 
@@ -45,7 +53,7 @@ def add_entry(message: str, tags: Optional[list[str]] = None) -> dict:
     Returns:
         The created entry dict
     """
-    _ensure_worklog()
+    worklog_file = _ensure_worklog()
 
     entry: dict[str, str | list[str]] = {
         "ts": datetime.now(timezone.utc).isoformat(),
@@ -54,12 +62,96 @@ def add_entry(message: str, tags: Optional[list[str]] = None) -> dict:
     if tags:
         entry["tags"] = tags
 
-    with get_worklog_file().open("a") as f:
+    with worklog_file.open("a") as f:
         f.write(json.dumps(entry) + "\n")
 
     return entry
 
 
+def _reverse_lines(path: Path, block_size: int = 8192) -> Iterator[bytes]:
+    """Yield the lines of a file from last to first, reading backwards in blocks."""
+    with path.open("rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        remainder = b""
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + remainder).split(b"\n")
+            # The first piece may be a partial line; finish it with the next block
+            remainder = lines.pop(0)
+            yield from reversed(lines)
+        yield remainder
+
+
+def _iter_entries(lines: Iterable[bytes]) -> Iterator[dict]:
+    """Parse JSONL lines lazily, skipping blank and malformed ones."""
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue  # Skip malformed entries
+
+
+def _parse_ts(ts: str) -> datetime:
+    """Parse an entry timestamp."""
+    return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+
+
+def _is_before(ts: str, since_dt: datetime, since_utc: Optional[str]) -> bool:
+    """Check whether an entry timestamp is earlier than the cutoff.
+
+    add_entry writes UTC isoformat() timestamps, which sort as plain strings
+    against since_utc (the cutoff in the same form); anything else is parsed.
+    """
+    if since_utc and ts.endswith("+00:00") and len(ts) in UTC_ISO_LENGTHS:
+        return ts < since_utc
+    return _parse_ts(ts) < since_dt
+
+
+def _next_entry_ts(f: BinaryIO, pos: int) -> Optional[tuple[int, datetime]]:
+    """Find the first readable entry starting at or after pos.
+
+    Returns:
+        Tuple of (offset just past that entry's line, its timestamp), or None at EOF
+    """
+    # Step back one byte so a line starting exactly at pos isn't discarded as partial
+    f.seek(max(pos - 1, 0))
+    if pos > 0:
+        f.readline()
+    for line in iter(f.readline, b""):
+        try:
+            return f.tell(), _parse_ts(json.loads(line)["ts"])
+        except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError, ValueError):
+            continue  # Blank or malformed line, try the next one
+    return None
+
+
+def _bisect_worklog(f: BinaryIO, since_dt: datetime) -> int:
+    """Find the offset of the first line that may hold an entry at or after since_dt.
+
+    Relies on the worklog being appended in time order; callers still filter the
+    entries read from the returned offset.
+    """
+    lo = 0
+    hi = f.seek(0, os.SEEK_END)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        found = _next_entry_ts(f, mid)
+        if found is None or found[1] >= since_dt:
+            hi = mid
+        else:
+            lo = min(found[0], hi)
+    # lo may fall mid-line; realign to the start of the next line
+    f.seek(max(lo - 1, 0))
+    if lo > 0:
+        f.readline()
+    return f.tell()
+
+
 def read_entries(
     limit: Optional[int] = None,
     since: Optional[str] = None,
@@ -67,7 +159,8 @@ def read_entries(
     """Read worklog entries.
 
     Args:
-        limit: Maximum number of entries to return (most recent first)
+        limit: Maximum number of entries to return (most recent first);
+            None, zero or negative means no limit
         since: ISO date string to filter entries after
 
     Returns:
@@ -76,6 +169,12 @@ def read_entries(
     worklog_file = get_worklog_file()
     if not worklog_file.exists():
         return []
+    if limit is not None and limit <= 0:
+        limit = None
+
+    if limit and not since:
+        # Entries are appended in order, so the newest are at the end of the file
+        return list(islice(_iter_entries(_reverse_lines(worklog_file)), limit))
 
     entries = []
     since_dt = None
@@ -89,19 +188,24 @@ def read_entries(
         except ValueError:
             pass  # Ignore invalid dates
 
-    with worklog_file.open() as f:
+    since_utc = None
+    if since_dt and since_dt.tzinfo:
+        since_utc = since_dt.astimezone(timezone.utc).isoformat()
+
+    with worklog_file.open("rb") as f:
+        if since_dt:
+            # Entries are appended in time order, so skip straight to the first recent one
+            f.seek(_bisect_worklog(f, since_dt))
         for line in f:
             line = line.strip()
             if not line:
                 continue
             try:
                 entry = json.loads(line)
-                if since_dt:
-                    entry_ts = datetime.fromisoformat(entry["ts"].replace("Z", "+00:00"))
-                    if entry_ts < since_dt:
-                        continue
+                if since_dt and _is_before(entry["ts"], since_dt, since_utc):
+                    continue
                 entries.append(entry)
-            except (json.JSONDecodeError, KeyError):
+            except (json.JSONDecodeError, UnicodeDecodeError, KeyError):
                 continue  # Skip malformed entries
 
     # Reverse for most recent first
@@ -113,12 +217,24 @@ def read_entries(
     return entries
 
 
+def _raw_prefilter(needle: str) -> Optional[bytes]:
+    """Bytes that any raw JSONL line matching needle must contain, if knowable.
+
+    Only printable ASCII queries without JSON-escaped characters appear verbatim in
+    the encoded line. Lines with \\u escapes or non-ASCII bytes may still hide a match
+    (e.g. a character that lowercases to ASCII), so callers must not skip those.
+    """
+    if needle.isascii() and needle.isprintable() and not any(c in needle for c in '"\\/'):
+        return needle.encode()
+    return None
+
+
 def search_entries(query: str, limit: Optional[int] = None) -> list[dict]:
     """Search worklog entries.
 
     Args:
         query: Search string (case-insensitive, matches message or tags)
-        limit: Maximum number of results
+        limit: Maximum number of results; None, zero or negative means no limit
 
     Returns:
         List of matching entry dicts, most recent first
@@ -126,36 +242,29 @@ def search_entries(query: str, limit: Optional[int] = None) -> list[dict]:
     worklog_file = get_worklog_file()
     if not worklog_file.exists():
         return []
-
-    pattern = re.compile(re.escape(query), re.IGNORECASE)
-    matches = []
-
-    with worklog_file.open() as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entry = json.loads(line)
-                # Search in message
-                if pattern.search(entry.get("msg", "")):
-                    matches.append(entry)
-                    continue
-                # Search in tags
-                for tag in entry.get("tags", []):
-                    if pattern.search(tag):
-                        matches.append(entry)
-                        break
-            except json.JSONDecodeError:
-                continue
-
-    # Reverse for most recent first
-    matches.reverse()
-
-    if limit:
-        matches = matches[:limit]
-
-    return matches
+    if limit is not None and limit <= 0:
+        limit = None
+
+    # The query is a literal substring, so lowercased containment beats a regex.
+    # str.lower() (not casefold()) keeps re.IGNORECASE's matching: "ss" != "ß".
+    needle = query.lower()
+    prefilter = _raw_prefilter(needle)
+
+    def may_match(line: bytes) -> bool:
+        # Skip lines that cannot match without decoding them
+        return (
+            prefilter is None or prefilter in line.lower() or not line.isascii() or b"\\u" in line
+        )
+
+    # Walk newest first so a limited search stops at the last match it needs
+    matches = (
+        entry
+        for entry in _iter_entries(filter(may_match, _reverse_lines(worklog_file)))
+        # Search in message, then tags (a raw hit may only be in the timestamp)
+        if needle in entry.get("msg", "").lower()
+        or any(needle in tag.lower() for tag in entry.get("tags", ()))
+    )
+    return list(islice(matches, limit))
 
 
 def format_entry_human(entry: dict) -> str:
@@ -177,3 +286,8 @@ def format_entry_human(entry: dict) -> str:
         tags_str = ""
 
     return f"{ts_display}  {msg}{tags_str}"
+
+
+def format_entries_human(entries: Iterable[dict]) -> Iterator[str]:
+    """Format entries as indented, newline-terminated lines for batch writing."""
+    return (f"  {format_entry_human(entry)}\n" for entry in entries)
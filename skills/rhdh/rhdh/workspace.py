@@ -7,7 +7,9 @@ rhdh-plugin-export-overlays.
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
@@ -16,81 +18,106 @@ from .config import get_overlay_repo
 
 @dataclass
 class WorkspaceInfo:
-    """Information about a plugin workspace."""
+    """Information about a plugin workspace.
+
+    source.json and the metadata directory are only read when their
+    properties are first accessed.
+    """
 
     name: str
     path: Path
-    repo: Optional[str] = None
-    repo_ref: Optional[str] = None
-    repo_backstage_version: Optional[str] = None
     has_source_json: bool = False
     has_plugins_list: bool = False
     has_backstage_json: bool = False
-    metadata_files: list[str] | None = None
+    has_metadata_dir: bool = False
 
     @classmethod
     def from_path(cls, path: Path) -> "WorkspaceInfo":
         """Create WorkspaceInfo from a workspace directory path."""
-        name = path.name
-
-        # Check which files exist
-        has_source_json = (path / "source.json").exists()
-        has_plugins_list = (path / "plugins-list.yaml").exists()
-        has_backstage_json = (path / "backstage.json").exists()
-
-        # Parse source.json if it exists
-        repo = None
-        repo_ref = None
-        repo_backstage_version = None
-
-        if has_source_json:
-            try:
-                source = json.loads((path / "source.json").read_text())
-                repo = source.get("repo")
-                repo_ref = source.get("repo-ref")
-                repo_backstage_version = source.get("repo-backstage-version")
-            except (json.JSONDecodeError, OSError):
-                pass
-
-        # List metadata files
-        metadata_files = None
-        metadata_dir = path / "metadata"
-        if metadata_dir.is_dir():
-            metadata_files = [f.name for f in metadata_dir.iterdir() if f.is_file()]
+        # One directory read gives every child and its type, instead of a stat each
+        try:
+            with os.scandir(path) as entries:
+                children = {entry.name: entry for entry in entries}
+        except OSError:
+            children = {}
+
+        def has(name: str, is_dir: bool = False) -> bool:
+            entry = children.get(name)
+            return entry is not None and (entry.is_dir() if is_dir else entry.is_file())
 
         return cls(
-            name=name,
+            name=path.name,
             path=path,
-            repo=repo,
-            repo_ref=repo_ref,
-            repo_backstage_version=repo_backstage_version,
-            has_source_json=has_source_json,
-            has_plugins_list=has_plugins_list,
-            has_backstage_json=has_backstage_json,
-            metadata_files=metadata_files,
+            has_source_json=has("source.json"),
+            has_plugins_list=has("plugins-list.yaml"),
+            has_backstage_json=has("backstage.json"),
+            has_metadata_dir=has("metadata", is_dir=True),
         )
 
-
-def list_workspaces() -> tuple[Optional[Path], list[WorkspaceInfo]]:
+    @cached_property
+    def source(self) -> dict:
+        """Parsed source.json, or empty dict if missing or invalid."""
+        if not self.has_source_json:
+            return {}
+        try:
+            with open(os.path.join(self.path, "source.json"), "rb") as f:
+                source = json.load(f)
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+            return {}
+        return source if isinstance(source, dict) else {}
+
+    @property
+    def repo(self) -> Optional[str]:
+        return self.source.get("repo")
+
+    @property
+    def repo_ref(self) -> Optional[str]:
+        return self.source.get("repo-ref")
+
+    @property
+    def repo_backstage_version(self) -> Optional[str]:
+        return self.source.get("repo-backstage-version")
+
+    @cached_property
+    def metadata_files(self) -> list[str] | None:
+        """Names of files in the metadata directory, or None if there is none."""
+        if not self.has_metadata_dir:
+            return None
+        with os.scandir(os.path.join(self.path, "metadata")) as entries:
+            return [entry.name for entry in entries if entry.is_file()]
+
+
+def _workspace_dirs(overlay_repo: Path) -> list[tuple[str, str]]:
+    """Sorted (name, path) strings of the workspace directories in an overlay repo."""
+    # DirEntry.is_dir() uses the type returned by the directory read, not a stat per entry.
+    # Siblings sort by name, so order the plain DirEntry strings before building any Path
+    try:
+        with os.scandir(overlay_repo / "workspaces") as entries:
+            return sorted((entry.name, entry.path) for entry in entries if entry.is_dir())
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def list_workspaces(
+    names_only: bool = False,
+) -> tuple[Optional[Path], list[WorkspaceInfo] | list[str]]:
     """List all plugin workspaces in the overlay repo.
 
+    Args:
+        names_only: Return just the workspace names, skipping each workspace's
+            directory listing and source.json
+
     Returns:
-        Tuple of (overlay_repo_path or None, list of WorkspaceInfo)
+        Tuple of (overlay_repo_path or None, list of WorkspaceInfo or of names)
     """
     overlay_repo = get_overlay_repo()
     if overlay_repo is None:
         return None, []
 
-    workspaces_dir = overlay_repo / "workspaces"
-    if not workspaces_dir.is_dir():
-        return overlay_repo, []
-
-    workspaces = []
-    for workspace_path in sorted(workspaces_dir.iterdir()):
-        if workspace_path.is_dir():
-            workspaces.append(WorkspaceInfo.from_path(workspace_path))
-
-    return overlay_repo, workspaces
+    workspace_dirs = _workspace_dirs(overlay_repo)
+    if names_only:
+        return overlay_repo, [name for name, _ in workspace_dirs]
+    return overlay_repo, [WorkspaceInfo.from_path(Path(path)) for _, path in workspace_dirs]
 
 
 def get_workspace(name: str) -> tuple[bool, Optional[WorkspaceInfo], str]:
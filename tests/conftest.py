@@ -38,6 +38,16 @@ SKILLS_DIR = RHDH_SKILL_DIR  # Legacy alias
 SKILL_DIR = RHDH_SKILL_DIR  # Legacy alias
 
 
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    """Drop per-process config caches so tests never see each other's repos."""
+    from rhdh import config
+
+    config.config_invalidate_cache()
+    yield
+    config.config_invalidate_cache()
+
+
 @pytest.fixture
 def skill_root():
     """Return the project root path."""
@@ -182,6 +192,7 @@ def run_cli_python(*args, env=None, isolated_env=None):
         CLIResult with returncode, stdout, stderr
     """
     # Import here to avoid circular imports and ensure fresh module state
+    from rhdh import cli as cli_module
     from rhdh import config as config_module
     from rhdh.cli import main
 
@@ -207,11 +218,13 @@ def run_cli_python(*args, env=None, isolated_env=None):
         with patch("sys.stdout", stdout_capture):
             # Patch find_git_root if we have an isolated env
             if mock_git_root:
+                # cli imports find_git_root by name, so patch its reference too
                 with patch.object(config_module, "find_git_root", return_value=mock_git_root):
-                    try:
-                        returncode = main(list(args))
-                    except SystemExit as e:
-                        returncode = e.code if isinstance(e.code, int) else 0
+                    with patch.object(cli_module, "find_git_root", return_value=mock_git_root):
+                        try:
+                            returncode = main(list(args))
+                        except SystemExit as e:
+                            returncode = e.code if isinstance(e.code, int) else 0
             else:
                 try:
                     returncode = main(list(args))
@@ -5,6 +5,10 @@ Output is JSON by default (non-TTY context), so we parse the structured response
 """
 
 import json
+import os
+from unittest.mock import patch
+
+import pytest
 
 
 def parse_response(result):
@@ -68,6 +72,109 @@ class TestCliStatus:
         assert "setup_options" not in response["data"]
         assert "doctor_workflow" not in response["data"]
 
+    def test_status_unconfigured_skips_tools(self, unconfigured_cli):
+        """With no repos configured, status should skip tool checks."""
+        result = unconfigured_cli()
+
+        response = parse_response(result)
+        names = {check["name"] for check in response["data"]["checks"]}
+        assert "gh_cli" not in names
+        assert "rhdh status --full" in response["next_steps"]
+
+    def test_status_quick_reuses_recent_result(self, cli, isolated_env):
+        """status --quick should return the cached result instead of re-probing."""
+        from rhdh import cli as cli_module
+
+        first = parse_response(cli("status", "--full"))
+        cache_file = isolated_env["config_dir"] / cli_module.STATUS_CACHE_FILE
+        assert cache_file.exists()
+
+        with patch.object(cli_module, "run_probes") as run_probes:
+            second = parse_response(cli("status", "--quick", "--max-age", "60"))
+        run_probes.assert_not_called()
+        assert second["data"] == first["data"]
+
+    def test_status_quick_ignores_stale_result(self, cli, isolated_env):
+        """status --quick should re-probe once the cached result is too old."""
+        from rhdh import cli as cli_module
+
+        cli("status", "--full")
+        cache_file = isolated_env["config_dir"] / cli_module.STATUS_CACHE_FILE
+        os.utime(cache_file, (0, 0))
+
+        with patch.object(cli_module, "run_probes", wraps=cli_module.run_probes) as run_probes:
+            cli("status", "--quick")
+        run_probes.assert_called_once()
+
+    def test_status_quick_ignores_result_from_before_config_change(self, cli, isolated_env):
+        """status --quick should re-probe after the config has been written."""
+        from rhdh import cli as cli_module
+
+        cli("status", "--full")
+        cli("config", "set", "github.username", "someone-else")
+
+        with patch.object(cli_module, "run_probes", wraps=cli_module.run_probes) as run_probes:
+            cli("status", "--quick", "--max-age", "60")
+        run_probes.assert_called_once()
+
+    @pytest.mark.parametrize("content", ["[]", "null", '{"cwd": "/"}'])
+    def test_status_quick_ignores_malformed_result(self, cli, isolated_env, content):
+        """status --quick should re-probe if the cached result isn't a status object."""
+        from rhdh import cli as cli_module
+
+        cli("status", "--full")
+        (isolated_env["config_dir"] / cli_module.STATUS_CACHE_FILE).write_text(content)
+
+        with patch.object(cli_module, "run_probes", wraps=cli_module.run_probes) as run_probes:
+            response = parse_response(cli("status", "--quick", "--max-age", "60"))
+        run_probes.assert_called_once()
+        assert response["success"] is True
+
+    def test_status_quick_human_matches_live_icons(self, unconfigured_cli, isolated_env):
+        """--human status --quick should render cached checks like a live run."""
+        from rhdh import cli as cli_module
+
+        live = unconfigured_cli("--human", "status", "--full").stdout
+        with patch.object(cli_module, "run_probes") as run_probes:
+            quick = unconfigured_cli("--human", "status", "--quick", "--max-age", "60").stdout
+        run_probes.assert_not_called()
+
+        assert "needs_setup" not in quick
+        # Optional repos keep their info icon rather than a failure cross
+        overlay_line = next(line for line in quick.splitlines() if "overlay:" in line)
+        assert "→" in overlay_line
+        assert "✗" not in overlay_line
+        assert overlay_line in live.splitlines()
+
+    def test_status_quick_reuses_unconfigured_result(self, unconfigured_cli, isolated_env):
+        """The skip-tools result for an unconfigured machine should be cached too."""
+        from rhdh import cli as cli_module
+
+        first = parse_response(unconfigured_cli("status"))
+        with patch.object(cli_module, "run_probes") as run_probes:
+            second = parse_response(unconfigured_cli("status", "--quick", "--max-age", "60"))
+        run_probes.assert_not_called()
+        assert second == first
+
+    def test_status_quick_ignores_result_from_before_env_override(
+        self, cli, isolated_env, tmp_path
+    ):
+        """status --quick should re-probe when a repo env override changes."""
+        from rhdh import cli as cli_module
+
+        cli("status", "--full")
+        with patch.object(cli_module, "run_probes", wraps=cli_module.run_probes) as run_probes:
+            cli("status", "--quick", "--max-age", "60", env={"RHDH_CLI_REPO": str(tmp_path)})
+        run_probes.assert_called_once()
+
+    def test_status_full_checks_tools(self, unconfigured_cli):
+        """status --full should check tools even when unconfigured."""
+        result = unconfigured_cli("status", "--full")
+
+        response = parse_response(result)
+        names = {check["name"] for check in response["data"]["checks"]}
+        assert "gh_cli" in names
+
 
 class TestCliDoctor:
     """Test CLI doctor command."""
@@ -228,6 +335,30 @@ class TestCliWorkspace:
         names = [item["name"] for item in items]
         assert "test-plugin" in names
 
+    def test_workspace_list_names_only(self, cli, isolated_env):
+        """workspace list --names-only should list names without source.json details."""
+        env = {"RHDH_OVERLAY_REPO": str(isolated_env["overlay_dir"])}
+
+        result = cli("workspace", "list", "--names-only", env=env)
+
+        assert result.returncode == 0
+        response = parse_response(result)
+        assert {"name": "test-plugin"} in response["data"]["items"]
+        assert response["data"]["count"] == len(response["data"]["items"])
+
+    def test_workspace_list_empty(self, cli, isolated_env, tmp_path):
+        """workspace list should report zero items for an overlay with no workspaces."""
+        empty_overlay = tmp_path / "empty-overlay"
+        (empty_overlay / "workspaces").mkdir(parents=True)
+        env = {"RHDH_OVERLAY_REPO": str(empty_overlay)}
+
+        result = cli("workspace", "list", env=env)
+
+        assert result.returncode == 0
+        response = parse_response(result)
+        assert response["data"]["count"] == 0
+        assert response["data"]["items"] == []
+
     def test_workspace_status_shows_details(self, cli, isolated_env):
         """workspace status should show workspace details."""
         # Use env var to override the default discovery
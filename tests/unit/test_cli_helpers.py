@@ -0,0 +1,242 @@
+"""Unit tests for rhdh.cli helper functions."""
+
+import os
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+GIT_ENV = {
+    **os.environ,
+    "GIT_AUTHOR_NAME": "test",
+    "GIT_AUTHOR_EMAIL": "test@test.com",
+    "GIT_COMMITTER_NAME": "test",
+    "GIT_COMMITTER_EMAIL": "test@test.com",
+}
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """Create a git repo with one commit on branch 'main'."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-b", "main"], cwd=repo, capture_output=True, check=True)
+    (repo / "README.md").write_text("# test\n")
+    subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
+    subprocess.run(
+        ["git", "commit", "-m", "init"], cwd=repo, capture_output=True, check=True, env=GIT_ENV
+    )
+    return repo
+
+
+class TestGetRepoSnapshot:
+    """Test get_repo_snapshot function."""
+
+    def test_clean_repo(self, git_repo):
+        from rhdh.cli import get_repo_snapshot
+
+        assert get_repo_snapshot(git_repo) == ("main", True, True)
+
+    def test_dirty_repo(self, git_repo):
+        from rhdh.cli import get_repo_snapshot
+
+        (git_repo / "new.txt").write_text("untracked\n")
+
+        branch, is_clean, is_git_repo = get_repo_snapshot(git_repo)
+        assert branch == "main"
+        assert is_clean is False
+        assert is_git_repo is True
+
+    def test_not_a_git_repo(self, tmp_path):
+        from rhdh.cli import get_repo_snapshot
+
+        _, _, is_git_repo = get_repo_snapshot(tmp_path)
+        assert is_git_repo is False
+
+
+class TestRunProbes:
+    """Test run_probes function."""
+
+    def test_returns_results_by_name(self):
+        from rhdh.cli import run_probes
+
+        results = run_probes({"a": lambda: 1, "b": lambda: (0, "out", "")})
+        assert results == {"a": 1, "b": (0, "out", "")}
+
+    def test_empty(self):
+        from rhdh.cli import run_probes
+
+        assert run_probes({}) == {}
+
+    def test_single_probe_runs_inline(self):
+        import threading
+
+        from rhdh.cli import run_probes
+
+        results = run_probes({"a": threading.current_thread})
+        assert results == {"a": threading.current_thread()}
+
+
+class TestResolveTool:
+    """Test resolve_tool caching."""
+
+    def test_looks_up_once(self):
+        from unittest.mock import patch
+
+        from rhdh.cli import check_tool, resolve_tool
+
+        resolve_tool.cache_clear()
+        with patch("shutil.which", return_value="/usr/bin/fake") as which:
+            assert check_tool("fake-tool") is True
+            assert resolve_tool("fake-tool") == "/usr/bin/fake"
+        which.assert_called_once_with("fake-tool")
+        resolve_tool.cache_clear()
+
+
+class TestGetGitBranch:
+    """Test get_git_branch function."""
+
+    def test_reads_branch_from_head(self, git_repo):
+        from rhdh.cli import get_git_branch
+
+        with patch("rhdh.cli.run_command") as run_command:
+            assert get_git_branch(git_repo) == "main"
+        run_command.assert_not_called()
+
+    def test_detached_head_returns_short_sha(self, git_repo):
+        from rhdh.cli import get_git_branch
+
+        sha = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=git_repo, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        subprocess.run(["git", "checkout", "--detach"], cwd=git_repo, capture_output=True)
+
+        assert get_git_branch(git_repo) == sha[:7]
+
+    def test_gitdir_file(self, git_repo, tmp_path):
+        from rhdh.cli import get_git_branch
+
+        worktree = tmp_path / "worktree"
+        subprocess.run(
+            ["git", "worktree", "add", "-b", "feature", str(worktree)],
+            cwd=git_repo,
+            capture_output=True,
+            check=True,
+        )
+
+        assert (worktree / ".git").is_file()
+        assert get_git_branch(worktree) == "feature"
+
+    def test_not_a_git_repo(self, tmp_path):
+        from rhdh.cli import get_git_branch
+
+        assert get_git_branch(tmp_path) == "unknown"
+
+
+class TestCheckGhAccess:
+    """Test check_gh_access function."""
+
+    def test_authenticated_with_access(self):
+        from rhdh.cli import check_gh_access
+
+        stdout = '{"data": {"viewer": {"login": "me"}, "repository": {"id": "R_1"}}}'
+        with patch("rhdh.cli.run_command", return_value=(0, stdout, "")):
+            assert check_gh_access() == (True, True)
+
+    def test_authenticated_without_access(self):
+        from rhdh.cli import check_gh_access
+
+        stdout = '{"data": {"viewer": {"login": "me"}, "repository": null}, "errors": []}'
+        with patch("rhdh.cli.run_command", return_value=(1, stdout, "")):
+            assert check_gh_access() == (True, False)
+
+    def test_not_authenticated(self):
+        from rhdh.cli import check_gh_access
+
+        with patch("rhdh.cli.run_command", return_value=(4, "", "gh auth login")):
+            assert check_gh_access() == (False, False)
+
+
+class TestRunCommandRcOnly:
+    """Test run_command_rc_only function."""
+
+    def test_returns_exit_code(self, git_repo, tmp_path):
+        from rhdh.cli import run_command_rc_only
+
+        assert run_command_rc_only(["git", "rev-parse", "--git-dir"], cwd=git_repo) == 0
+        assert run_command_rc_only(["git", "rev-parse", "--git-dir"], cwd=tmp_path) != 0
+
+    def test_missing_command(self):
+        from rhdh.cli import run_command_rc_only
+
+        assert run_command_rc_only(["definitely-not-a-real-command-xyz"]) == -1
+
+
+class TestRunCommandRaw:
+    """Test run_command_raw function."""
+
+    def test_returns_undecoded_stdout(self, git_repo):
+        from rhdh.cli import run_command_raw
+
+        rc, stdout = run_command_raw(["git", "branch", "--show-current"], cwd=git_repo)
+        assert rc == 0
+        assert stdout == b"main\n"
+
+    def test_missing_command(self):
+        from rhdh.cli import run_command_raw
+
+        assert run_command_raw(["definitely-not-a-real-command-xyz"]) == (-1, b"")
+
+
+class TestLazyParser:
+    """Test lazy subparser construction."""
+
+    @pytest.mark.parametrize(
+        ("argv", "expected"),
+        [
+            ([], "status"),
+            (["--json"], "status"),
+            (["--json", "todo", "list"], "todo"),
+            (["workspace", "--help"], "workspace"),
+            (["--help"], "help"),
+            (["--version"], "help"),
+            (["help"], "help"),
+            (["bogus"], "help"),
+        ],
+    )
+    def test_select_command(self, argv, expected):
+        from rhdh.cli import _select_command
+
+        assert _select_command(argv) == expected
+
+    def test_only_registers_selected_command(self):
+        from rhdh.cli import create_parser
+
+        args = create_parser(only="todo").parse_args(["todo", "list", "--pending"])
+        assert args.todo_command == "list"
+        assert args.pending is True
+
+        with pytest.raises(SystemExit):
+            create_parser(only="todo").parse_args(["log", "show"])
+
+    def test_main_reuses_parser(self, capsys):
+        from rhdh.cli import _cached_parser, main
+
+        _cached_parser.cache_clear()
+        main(["--json", "help"])
+        main(["--json", "help"])
+        assert _cached_parser.cache_info().misses == 1
+        assert _cached_parser.cache_info().hits == 1
+
+    def test_help_lists_commands_without_building_them(self):
+        from rhdh.cli import _COMMANDS, create_parser
+
+        parser = create_parser(only="help")
+        help_text = parser.format_help()
+        for name, (summary, _build) in _COMMANDS.items():
+            assert name in help_text
+            assert summary in help_text
+
+        # Command arguments were never registered
+        with pytest.raises(SystemExit):
+            parser.parse_args(["todo", "list"])
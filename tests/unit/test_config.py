@@ -126,6 +126,85 @@ class TestFindRepo:
         result = config.get_repo("nonexistent_key")
         assert result is None
 
+    def test_get_repo_cached_until_config_saved(self, tmp_path, monkeypatch):
+        """get_repo() should reuse its result until config is written."""
+        from rhdh import config
+
+        monkeypatch.delenv("RHDH_CLI_REPO", raising=False)
+        monkeypatch.setenv("SKILL_ROOT", str(tmp_path))
+        config.USER_CONFIG_DIR = tmp_path / ".config" / "rhdh"
+        config.USER_CONFIG_FILE = config.USER_CONFIG_DIR / "config.json"
+
+        repo_dir = tmp_path / "rhdh-cli"
+        repo_dir.mkdir()
+
+        with patch.object(config, "find_git_root", return_value=tmp_path):
+            assert config.get_repo("cli") is None
+            with patch.object(config, "find_repo") as find_repo:
+                assert config.get_repo("cli") is None
+                find_repo.assert_not_called()
+
+            config.save_config({"repos": {"cli": str(repo_dir)}}, global_=True)
+            assert config.get_repo("cli") == repo_dir.resolve()
+
+    def test_get_local_setup_dir_cached_per_override(self, tmp_path, monkeypatch):
+        """get_local_setup_dir() should reuse its result while the overrides are unchanged."""
+        from rhdh import config
+
+        first = tmp_path / "setup-a"
+        second = tmp_path / "setup-b"
+        first.mkdir()
+        second.mkdir()
+
+        monkeypatch.setenv("RHDH_LOCAL_SETUP_DIR", str(first))
+        assert config.get_local_setup_dir() == first.resolve()
+        with patch.object(config, "find_local_setup_dir") as find:
+            assert config.get_local_setup_dir() == first.resolve()
+            find.assert_not_called()
+
+        monkeypatch.setenv("RHDH_LOCAL_SETUP_DIR", str(second))
+        assert config.get_local_setup_dir() == second.resolve()
+
+    def test_resolve_all_repos_reads_config_once(self, tmp_path, monkeypatch):
+        """All repos should be discovered from a single merged config load."""
+        from rhdh import config
+
+        monkeypatch.delenv("RHDH_OVERLAY_REPO", raising=False)
+        monkeypatch.setenv("SKILL_ROOT", str(tmp_path))
+        repo_dir = tmp_path / "overlays"
+        repo_dir.mkdir()
+        merged = {"repos": {"overlay": str(repo_dir)}}
+
+        with patch.object(config, "load_merged_config", return_value=merged) as load:
+            resolved = config.resolve_all_repos()
+            assert config.get_repo("overlay") == repo_dir.resolve()
+
+        load.assert_called_once()
+        assert resolved["overlay"] == repo_dir.resolve()
+        assert set(resolved) == {info["config_key"] for info in config.SUBMODULE_REPOS.values()}
+
+    def test_config_show_reuses_loaded_config(self, tmp_path, monkeypatch):
+        """config show should resolve repos from the configs it already loaded."""
+        from rhdh import config
+
+        monkeypatch.delenv("RHDH_OVERLAY_REPO", raising=False)
+        monkeypatch.delenv("RHDH_LOCAL_SETUP_DIR", raising=False)
+        monkeypatch.setenv("SKILL_ROOT", str(tmp_path))
+        config.USER_CONFIG_DIR = tmp_path / ".config"
+        config.USER_CONFIG_FILE = config.USER_CONFIG_DIR / "config.json"
+        repo_dir = tmp_path / "overlays"
+        repo_dir.mkdir()
+        config.USER_CONFIG_DIR.mkdir()
+        config.USER_CONFIG_FILE.write_text(json.dumps({"repos": {"overlay": str(repo_dir)}}))
+
+        with patch.object(config, "find_git_root", return_value=tmp_path):
+            with patch.object(config, "load_merged_config") as load:
+                success, data, _ = config.run_config("show")
+
+        load.assert_not_called()
+        assert success is True
+        assert data["resolved"]["overlay"] == str(repo_dir.resolve())
+
 
 class TestConfigInit:
     """Test config_init function (legacy API).
@@ -329,6 +408,64 @@ class TestLoadSaveConfig:
 
             assert loaded == original
 
+    def test_load_user_config_parses_once_until_file_changes(self, tmp_path):
+        """load_user_config should reuse the parsed file until it changes on disk."""
+        import os
+
+        from rhdh import config
+
+        config.USER_CONFIG_FILE = tmp_path / "config.json"
+        config.USER_CONFIG_FILE.write_text('{"a": 1}')
+
+        with patch.object(config.json, "loads", wraps=json.loads) as loads:
+            first = config.load_user_config()
+            first["mutated"] = True
+            assert config.load_user_config() == {"a": 1}
+            assert loads.call_count == 1
+
+            config.USER_CONFIG_FILE.write_text('{"a": 22}')
+            os.utime(config.USER_CONFIG_FILE, ns=(0, 0))
+            assert config.load_user_config() == {"a": 22}
+            assert loads.call_count == 2
+
+    def test_save_config_writes_through_symlink(self, tmp_path):
+        """save_config should update a symlinked config's target and keep its mode."""
+        import os
+
+        from rhdh import config
+
+        real = tmp_path / "dotfiles" / "config.json"
+        real.parent.mkdir()
+        real.write_text("{}")
+        real.chmod(0o640)
+        config.USER_CONFIG_DIR = tmp_path / ".config"
+        config.USER_CONFIG_DIR.mkdir()
+        config.USER_CONFIG_FILE = config.USER_CONFIG_DIR / "config.json"
+        config.USER_CONFIG_FILE.symlink_to(real)
+
+        assert config.save_config({"a": 1}, global_=True) is True
+
+        assert config.USER_CONFIG_FILE.is_symlink()
+        assert json.loads(real.read_text()) == {"a": 1}
+        assert real.stat().st_mode & 0o777 == 0o640
+        assert os.listdir(real.parent) == ["config.json"]
+
+    def test_write_file_atomic_cleans_up_on_failure(self, tmp_path):
+        """A failed write should leave the original file and no temp file behind."""
+        import os
+
+        from rhdh import config
+
+        path = tmp_path / "TODO.md"
+        path.write_text("original")
+
+        with patch.object(config.os, "replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                config.write_file_atomic(path, "new")
+
+        assert path.read_text() == "original"
+        assert os.listdir(tmp_path) == ["TODO.md"]
+
 
 class TestMergedConfig:
     """Test merged config behavior (project overrides user)."""
@@ -371,6 +508,27 @@ class TestMergedConfig:
             assert merged["user_only"] == "value"
             assert merged["project_only"] == "value"
 
+    def test_merges_once_until_a_file_changes(self, tmp_path):
+        """load_merged_config should reuse the merge until either file changes on disk."""
+        import os
+
+        from rhdh import config
+
+        config.USER_CONFIG_FILE = tmp_path / "config.json"
+        config.USER_CONFIG_FILE.write_text('{"repos": {"overlay": "/user"}}')
+
+        with patch.object(config, "find_git_root", return_value=tmp_path / "project"):
+            with patch.object(config, "deep_merge", wraps=config.deep_merge) as merge:
+                first = config.load_merged_config()
+                first["repos"]["overlay"] = "/mutated"
+                assert config.load_merged_config() == {"repos": {"overlay": "/user"}}
+                assert merge.call_count == 1
+
+                config.USER_CONFIG_FILE.write_text('{"repos": {"overlay": "/changed"}}')
+                os.utime(config.USER_CONFIG_FILE, ns=(0, 0))
+                assert config.load_merged_config() == {"repos": {"overlay": "/changed"}}
+                assert merge.call_count == 2
+
 
 class TestDotNotation:
     """Test dot-notation helper functions."""
@@ -435,3 +593,151 @@ class TestDotNotation:
 
         assert parse_value("/some/path") == "/some/path"
         assert parse_value("hello world") == "hello world"
+        assert parse_value("") == ""
+        assert parse_value("1.2.3") == "1.2.3"
+        assert parse_value(" 42") == 42
+
+
+class TestGitMetadata:
+    """Test git metadata readers that avoid running git."""
+
+    def test_get_remote_url(self, tmp_path):
+        """get_remote_url should read remotes from .git/config."""
+        import subprocess
+
+        from rhdh.config import get_remote_url
+
+        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True, check=True)
+        subprocess.run(
+            ["git", "remote", "add", "origin", "https://github.com/me/rhdh.git"],
+            cwd=tmp_path,
+            capture_output=True,
+            check=True,
+        )
+
+        assert get_remote_url(tmp_path) == "https://github.com/me/rhdh.git"
+        assert get_remote_url(tmp_path, "upstream") is None
+
+    def test_get_remote_url_not_a_repo(self, tmp_path):
+        """get_remote_url should return None outside a git repo."""
+        from rhdh.config import get_remote_url
+
+        assert get_remote_url(tmp_path) is None
+
+    def test_find_git_root_walks_up_without_git(self, tmp_path, monkeypatch):
+        """find_git_root should find the enclosing repo from a subdirectory in-process."""
+        import subprocess
+
+        from rhdh.config import find_git_root
+
+        repo = tmp_path / "repo"
+        subprocess.run(["git", "init", str(repo)], capture_output=True, check=True)
+        nested = repo / "a" / "b"
+        nested.mkdir(parents=True)
+        worktree = tmp_path / "worktree"
+        worktree.mkdir()
+        (worktree / ".git").write_text("gitdir: ../repo/.git/worktrees/wt\n")
+
+        with patch("subprocess.run") as run:
+            monkeypatch.chdir(nested)
+            assert find_git_root() == repo.resolve()
+            monkeypatch.chdir(worktree)
+            assert find_git_root() == worktree.resolve()
+            monkeypatch.chdir(tmp_path)
+            assert find_git_root() is None
+        run.assert_not_called()
+
+    def test_find_git_dir_follows_gitdir_file(self, tmp_path):
+        """find_git_dir should follow a 'gitdir:' pointer file."""
+        from rhdh.config import find_git_dir
+
+        real_git_dir = tmp_path / "modules" / "repo"
+        real_git_dir.mkdir(parents=True)
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        (repo / ".git").write_text("gitdir: ../modules/repo\n")
+
+        assert find_git_dir(repo) == real_git_dir.resolve()
+
+
+class TestGithubUsername:
+    """Test GitHub username lookup."""
+
+    def test_gh_probed_once_per_process(self, tmp_path):
+        """Without a configured username, gh should only be asked once."""
+        import subprocess
+
+        from rhdh import config
+
+        config.USER_CONFIG_DIR = tmp_path / ".config"
+        config.USER_CONFIG_FILE = config.USER_CONFIG_DIR / "config.json"
+        result = subprocess.CompletedProcess([], 0, stdout="octocat\n", stderr="")
+
+        with patch.object(config, "find_git_root", return_value=tmp_path):
+            with patch("subprocess.run", return_value=result) as run:
+                assert config.get_github_username() == "octocat"
+                assert config.get_github_username() == "octocat"
+
+        run.assert_called_once()
+
+    def test_detected_username_saved_to_user_config(self, tmp_path):
+        """A username found via gh should be remembered for later runs."""
+        import subprocess
+
+        from rhdh import config
+
+        config.USER_CONFIG_DIR = tmp_path / ".config"
+        config.USER_CONFIG_FILE = config.USER_CONFIG_DIR / "config.json"
+        result = subprocess.CompletedProcess([], 0, stdout="octocat\n", stderr="")
+
+        with patch.object(config, "find_git_root", return_value=tmp_path):
+            with patch("subprocess.run", return_value=result):
+                config.get_github_username()
+            config.config_invalidate_cache()
+            with patch("subprocess.run") as run:
+                assert config.get_github_username() == "octocat"
+
+        run.assert_not_called()
+        assert config.load_user_config() == {"github": {"username": "octocat"}}
+
+
+class TestSetupSubmodule:
+    """Test setup_submodule."""
+
+    def test_uses_given_git_root(self, tmp_path):
+        """A git_root passed in should be used without asking git."""
+        from rhdh import config
+
+        with patch.object(config, "find_git_root", side_effect=AssertionError("git asked")):
+            success, data, _ = config.setup_submodule("rhdh", dry_run=True, git_root=tmp_path)
+
+        assert success is True
+        assert data["actions"][0] == f"Would create submodule at: {tmp_path / 'repo' / 'rhdh'}"
+
+
+class TestListSubmoduleRepos:
+    """Test list_submodule_repos."""
+
+    def test_reports_submodules_and_plain_directories(self, tmp_path):
+        """Entries in .gitmodules are submodules; other checkouts under repo/ are reported."""
+        from rhdh import config
+
+        (tmp_path / ".gitmodules").write_text(
+            '[submodule "repo/rhdh-cli"]\n\tpath = repo/rhdh-cli\n\turl = git@github.com:me/rhdh-cli\n'
+        )
+        (tmp_path / "repo" / "rhdh").mkdir(parents=True)
+        (tmp_path / "repo" / "backstage").mkdir()
+
+        with patch.object(config, "find_git_root", return_value=tmp_path):
+            with patch.object(config, "get_github_username", return_value="me"):
+                with patch.object(config, "resolve_all_repos", return_value={}):
+                    repos = {r["name"]: r for r in config.list_submodule_repos()}
+
+        assert repos["rhdh-cli"]["status"] == "submodule"
+        # A prefix of a listed submodule path is not itself a submodule
+        assert repos["rhdh"]["status"] == "directory_exists"
+        assert repos["backstage"]["status"] == "directory_exists"
+        assert repos["backstage"]["path"] == str(tmp_path / "repo" / "backstage")
+        assert repos["rhdh-chart"]["status"] == "not_configured"
+        assert config.is_submodule(tmp_path / "repo" / "rhdh-cli", tmp_path) is True
+        assert config.is_submodule(tmp_path / "repo" / "rhdh", tmp_path) is False
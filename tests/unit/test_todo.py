@@ -114,6 +114,27 @@ Done!
         assert len(todos) == 1
         assert todos[0].title == "Real todo"
 
+    def test_sections_end_at_next_header(self, temp_config_dir):
+        from rhdh.todo import get_todo_file, list_todos
+
+        content = """# Todos
+
+## [ ] First
+**Created:** 2025-01-01
+**Context:** ctx
+## [x] Second
+**Completed:** 2025-01-02
+"""
+        get_todo_file().write_text(content)
+        first, second = list_todos()
+        assert first.raw_content == "## [ ] First\n**Created:** 2025-01-01\n**Context:** ctx"
+        assert first.context == "ctx"
+        assert second.raw_content == "## [x] Second\n**Completed:** 2025-01-02\n"
+        assert second.created is None
+        assert second.completed == "2025-01-02"
+        raw = content.encode()[second.offset_start : second.offset_end]
+        assert raw.decode() == second.raw_content
+
     def test_filter_pending_only(self, temp_config_dir):
         from rhdh.todo import get_todo_file, list_todos
 
@@ -179,6 +200,44 @@ class TestMarkDone:
         todos = list_todos()
         assert todos[0].done is True
 
+    def test_reuses_content_written_by_this_process(self, temp_config_dir):
+        from unittest.mock import patch
+
+        from rhdh.todo import add_note, add_todo, get_todo_file, mark_done
+
+        add_todo("Task to complete")
+        with patch.object(Path, "read_bytes", autospec=True, side_effect=Path.read_bytes) as read:
+            mark_done("task-to")
+            todo = add_note("task-to", "wrapped up")
+        read.assert_not_called()
+        assert "wrapped up" in todo.raw_content
+        assert "wrapped up" in get_todo_file().read_text()
+        assert [p.name for p in temp_config_dir.iterdir()] == ["TODO.md"]
+
+    def test_sees_external_edits(self, temp_config_dir):
+        from rhdh.todo import add_todo, get_todo_file, mark_done
+
+        add_todo("Task to complete")
+        todo_file = get_todo_file()
+        todo_file.write_text(todo_file.read_text().replace("Task to complete", "Renamed task"))
+
+        assert mark_done("task-to") is None
+        assert mark_done("renamed").done is True
+
+    def test_after_non_ascii_todo(self, temp_config_dir):
+        from rhdh.todo import add_todo, get_todo_file, list_todos, mark_done
+
+        add_todo("Second")
+        add_todo("Première tâche — naïve", context="café")
+        mark_done("second")
+
+        first, second = list_todos()
+        assert first.title == "Première tâche — naïve"
+        assert first.context == "café"
+        assert first.done is False
+        assert second.done is True
+        assert get_todo_file().read_text().count("## [x] Second\n") == 1
+
     def test_returns_none_for_unknown_slug(self, temp_config_dir):
         from rhdh.todo import mark_done
 
@@ -198,6 +257,36 @@ class TestAddNote:
         content = get_todo_file().read_text()
         assert "This is a note" in content
 
+    def test_creates_notes_section_if_missing(self, temp_config_dir):
+        from rhdh.todo import add_note, get_todo_file
+
+        get_todo_file().write_text("""# Todos
+
+---
+
+## [ ] No notes yet
+**Created:** 2025-01-01
+
+---
+""")
+        todo = add_note("no-notes", "First note")
+
+        assert todo is not None
+        assert "### Notes\n- " in todo.raw_content
+        assert "First note" in todo.raw_content
+        assert get_todo_file().read_text().endswith("First note\n\n---\n")
+
+    def test_notes_heading_at_end_of_file(self, temp_config_dir):
+        from rhdh.todo import add_note, get_todo_file
+
+        get_todo_file().write_text("# Todos\n\n---\n\n## [ ] Last one\n\n### Notes")
+        todo = add_note("last-one", "First note")
+
+        assert todo is not None
+        content = get_todo_file().read_text()
+        assert content.startswith("# Todos\n\n---\n\n## [ ] Last one\n\n### Notes\n- ")
+        assert content.endswith(": First note\n")
+
     def test_returns_none_for_unknown_slug(self, temp_config_dir):
         from rhdh.todo import add_note
 
@@ -2,6 +2,7 @@
 
 import json
 import tempfile
+from datetime import datetime
 from pathlib import Path
 
 import pytest
@@ -79,6 +80,34 @@ class TestReadEntries:
         entries = read_entries(limit=5)
         assert len(entries) == 5
 
+    def test_limit_reads_from_end_of_file(self, temp_config_dir):
+        from rhdh.worklog import _reverse_lines, get_worklog_file, read_entries
+
+        lines = [
+            json.dumps({"ts": "2025-01-01T00:00:00+00:00", "msg": f"Entry {i}"}) for i in range(50)
+        ]
+        lines.insert(45, "not json")
+        lines.insert(47, "")
+        get_worklog_file().write_text("\n".join(lines) + "\n")
+
+        entries = read_entries(limit=10)
+        assert [e["msg"] for e in entries] == [f"Entry {i}" for i in range(49, 39, -1)]
+        assert entries == read_entries()[:10]
+        # Small blocks exercise lines split across block boundaries
+        content = get_worklog_file().read_bytes()
+        assert list(_reverse_lines(get_worklog_file(), block_size=7)) == list(
+            reversed(content.split(b"\n"))
+        )
+
+    def test_non_positive_limit_means_no_limit(self, temp_config_dir):
+        from rhdh.worklog import add_entry, read_entries
+
+        for i in range(3):
+            add_entry(f"Entry {i}")
+        assert len(read_entries(limit=0)) == 3
+        assert len(read_entries(limit=-1)) == 3
+        assert len(read_entries(limit=-1, since="2000-01-01")) == 3
+
     def test_since_filter(self, temp_config_dir):
         from rhdh.worklog import get_worklog_file, read_entries
 
@@ -91,6 +120,45 @@ class TestReadEntries:
         assert len(entries) == 1
         assert entries[0]["msg"] == "New"
 
+    def test_since_compares_mixed_timestamp_forms(self, temp_config_dir):
+        from rhdh.worklog import get_worklog_file, read_entries
+
+        get_worklog_file().write_text(
+            '{"ts": "2025-03-01T01:00:00+02:00", "msg": "Before, in another zone"}\n'
+            '{"ts": "2025-02-28T23:59:59.999999+00:00", "msg": "Just before"}\n'
+            '{"ts": "2025-03-01T00:00:00+00:00", "msg": "At cutoff"}\n'
+            '{"ts": "2025-03-01T00:00:00.000001Z", "msg": "Just after"}\n'
+        )
+        entries = read_entries(since="2025-03-01")
+        assert [e["msg"] for e in entries] == ["Just after", "At cutoff"]
+
+    def test_since_bisects_large_log(self, temp_config_dir):
+        from rhdh.worklog import get_worklog_file, read_entries
+
+        lines = [
+            json.dumps({"ts": f"2025-01-{day:02d}T{hour:02d}:00:00+00:00", "msg": f"{day}/{hour}"})
+            for day in range(1, 29)
+            for hour in range(24)
+        ]
+        lines[100:100] = ["", "garbage", '{"msg": "no timestamp"}']
+        get_worklog_file().write_text("\n".join(lines) + "\n")
+
+        all_entries = read_entries()
+        for since in [
+            "2024-12-31",
+            "2025-01-01",
+            "2025-01-05T13:00:00Z",
+            "2025-01-28",
+            "2026-01-01",
+        ]:
+            since_dt = datetime.fromisoformat(
+                since.replace("Z", "+00:00") if "T" in since else since + "T00:00:00+00:00"
+            )
+            expected = [
+                e for e in all_entries if "ts" in e and datetime.fromisoformat(e["ts"]) >= since_dt
+            ]
+            assert read_entries(since=since) == expected
+
 
 class TestSearchEntries:
     """Tests for search_entries function."""
@@ -118,3 +186,55 @@ class TestSearchEntries:
         add_entry("UPPERCASE message")
         matches = search_entries("uppercase")
         assert len(matches) == 1
+
+    def test_query_is_literal(self, temp_config_dir):
+        from rhdh.worklog import add_entry, search_entries
+
+        add_entry("Bumped to 1.2.3 (backport)")
+        add_entry("Bumped to 1x2y3")
+        matches = search_entries("1.2.3 (")
+        assert [m["msg"] for m in matches] == ["Bumped to 1.2.3 (backport)"]
+
+    def test_matches_escaped_and_non_ascii_text(self, temp_config_dir):
+        from rhdh.worklog import add_entry, search_entries
+
+        add_entry('Quoted "name" path a/b')
+        add_entry("Fixed Straße lookup", tags=["\u212aeycloak"])
+        year = add_entry("Planning")["ts"][:4]
+        add_entry(f"{year} release notes")
+
+        assert len(search_entries('"name"')) == 1
+        assert len(search_entries("a/b")) == 1
+        assert len(search_entries("straße")) == 1
+        # Plain case-insensitivity, not Unicode case folding: "ss" doesn't match "ß"
+        assert search_entries("strasse") == []
+        assert len(search_entries("keycloak")) == 1
+        # Every timestamp contains the year but only messages and tags are searched
+        assert [m["msg"] for m in search_entries(year)] == [f"{year} release notes"]
+
+    def test_limit_keeps_most_recent_matches(self, temp_config_dir):
+        from rhdh.worklog import add_entry, search_entries
+
+        for i in range(5):
+            add_entry(f"deploy {i}")
+        add_entry("unrelated")
+
+        assert [m["msg"] for m in search_entries("deploy", limit=2)] == ["deploy 4", "deploy 3"]
+        assert len(search_entries("deploy", limit=0)) == 5
+        assert len(search_entries("deploy", limit=-1)) == 5
+
+
+class TestFormatEntries:
+    """Tests for human formatting of entries."""
+
+    def test_format_entries_human(self):
+        from rhdh.worklog import format_entries_human
+
+        entries = [
+            {"ts": "2025-01-02T03:04:05+00:00", "msg": "First", "tags": ["a", "b"]},
+            {"ts": "2025-01-03T00:00:00+00:00", "msg": "Second"},
+        ]
+        assert list(format_entries_human(entries)) == [
+            "  2025-01-02 03:04  First [a, b]\n",
+            "  2025-01-03 00:00  Second\n",
+        ]
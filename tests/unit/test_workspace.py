@@ -89,6 +89,36 @@ class TestWorkspaceInfo:
         assert info.has_source_json is True  # File exists
         assert info.repo is None  # But couldn't parse
 
+    def test_source_json_read_on_first_access(self, tmp_path):
+        """source.json should be parsed lazily, once."""
+        from rhdh.workspace import WorkspaceInfo
+
+        workspace = tmp_path / "my-plugin"
+        workspace.mkdir()
+        source = workspace / "source.json"
+        source.write_text('{"repo": "https://example.com/old"}')
+
+        info = WorkspaceInfo.from_path(workspace)
+        source.write_text('{"repo": "https://example.com/new", "repo-ref": "abc"}')
+
+        assert info.repo == "https://example.com/new"
+        source.unlink()
+        assert info.repo_ref == "abc"
+
+    def test_from_path_ignores_wrong_entry_types(self, tmp_path):
+        """Expected files must be files and metadata must be a directory."""
+        from rhdh.workspace import WorkspaceInfo
+
+        workspace = tmp_path / "my-plugin"
+        workspace.mkdir()
+        (workspace / "source.json").mkdir()
+        (workspace / "metadata").write_text("not a directory")
+
+        info = WorkspaceInfo.from_path(workspace)
+
+        assert info.has_source_json is False
+        assert info.metadata_files is None
+
 
 class TestListWorkspaces:
     """Test list_workspaces function."""
@@ -150,6 +180,41 @@ class TestListWorkspaces:
         names = [w.name for w in workspaces]
         assert sorted(names) == ["plugin-a", "plugin-b", "plugin-c"]
 
+    def test_skips_files_and_follows_symlinks(self, tmp_path, monkeypatch):
+        """Should list directories (including symlinked ones) in name order."""
+        from rhdh.workspace import list_workspaces
+
+        overlay_dir = tmp_path / "overlay"
+        workspaces_dir = overlay_dir / "workspaces"
+        workspaces_dir.mkdir(parents=True)
+        (workspaces_dir / "zeta").mkdir()
+        (workspaces_dir / "README.md").write_text("# Workspaces")
+        (tmp_path / "elsewhere").mkdir()
+        (workspaces_dir / "alpha").symlink_to(tmp_path / "elsewhere")
+
+        monkeypatch.setenv("RHDH_OVERLAY_REPO", str(overlay_dir))
+
+        _, workspaces = list_workspaces()
+
+        assert [w.name for w in workspaces] == ["alpha", "zeta"]
+
+    def test_names_only(self, tmp_path, monkeypatch):
+        """names_only should return sorted directory names."""
+        from rhdh.workspace import list_workspaces
+
+        overlay_dir = tmp_path / "overlay"
+        workspaces_dir = overlay_dir / "workspaces"
+        workspaces_dir.mkdir(parents=True)
+        (workspaces_dir / "plugin-b").mkdir()
+        (workspaces_dir / "plugin-a").mkdir()
+        (workspaces_dir / "notes.txt").write_text("not a workspace")
+
+        monkeypatch.setenv("RHDH_OVERLAY_REPO", str(overlay_dir))
+
+        _, names = list_workspaces(names_only=True)
+
+        assert names == ["plugin-a", "plugin-b"]
+
 
 class TestGetWorkspace:
     """Test get_workspace function."""